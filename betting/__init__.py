@@ -5,7 +5,7 @@ Betting analysis package
 from .data_loader import DataLoader
 from .stat_calculator import StatCalculator
 from .bet_predictor import BetPredictor
-from .team_quality import TeamQualityAnalyzer
+from .team_quality import TeamQualityAnalyzer, compute_quality_ratings
 from .player_mapper import PlayerMapper
 from .backtest import BacktestAnalyzer, print_backtest_analysis
 from .bet_builder_live import LiveBetBuilder, print_live_analysis
@@ -15,6 +15,7 @@ __all__ = [
     'StatCalculator',
     'BetPredictor',
     'TeamQualityAnalyzer',
+    'compute_quality_ratings',
     'PlayerMapper',
     'BacktestAnalyzer',
     'print_backtest_analysis',
@@ -3,9 +3,104 @@ Bet Predictor - BALANCED
 Find the sweet spot: high confidence + good value
 """
 
+import heapq
+import math
+import sys
+from operator import itemgetter
 from typing import Dict, List, Optional
 
 
+# Over/under line tables, written below as (line, base_conf, odds, is_over,
+# buffer_needed). Built once at import rather than on every predict call, then
+# replaced by _by_confidence with rows ordered by confidence (so the first
+# passing line is the best one) and extended to
+# (line, base_conf, odds, is_over, buffer_needed, direction, selection)
+
+# Sweet spot: lines between 5.5 and 11.5 corners
+_CORNER_OPTIONS = (
+    # OVERS - sweet spot for value
+    (5.5, 96, 1.15, True, 2.5),    # avg > 8.0 = 96% confident
+    (6.5, 94, 1.25, True, 2.0),    # avg > 8.5 = 94% confident
+    (7.5, 91, 1.40, True, 2.0),    # avg > 9.5 = 91% confident
+    (8.5, 88, 1.50, True, 1.5),    # avg > 10.0 = 88% confident
+    (9.5, 84, 1.70, True, 1.5),    # avg > 11.0 = 84% confident
+    (10.5, 79, 1.90, True, 1.5),   # avg > 12.0 = 79% confident
+    (11.5, 73, 2.10, True, 1.5),   # avg > 13.0 = 73% confident
+    
+    # UNDERS - for low-scoring matches
+    (13.5, 91, 1.40, False, -2.0), # avg < 11.5 = 91% confident
+    (12.5, 86, 1.60, False, -1.5), # avg < 11.0 = 86% confident
+    (11.5, 80, 1.83, False, -1.5), # avg < 10.0 = 80% confident
+)
+
+# Sweet spot: lines between 1.5 and 5.5 cards
+_CARD_OPTIONS = (
+    # OVERS
+    (1.5, 96, 1.10, True, 1.0),    # avg > 2.5 = 96% confident
+    (2.5, 92, 1.40, True, 0.8),    # avg > 3.3 = 92% confident
+    (3.5, 87, 1.75, True, 0.7),    # avg > 4.2 = 87% confident
+    (4.5, 79, 2.00, True, 0.7),    # avg > 5.2 = 79% confident
+    (5.5, 70, 2.40, True, 0.7),    # avg > 6.2 = 70% confident
+    
+    # UNDERS
+    (6.5, 91, 1.40, False, -1.0),  # avg < 5.5 = 91% confident
+    (5.5, 84, 1.70, False, -0.7),  # avg < 4.8 = 84% confident
+)
+
+# Sweet spot: lines between 1.5 and 3.5 goals
+_GOAL_OPTIONS = (
+    # OVERS
+    (1.5, 93, 1.25, True, 0.6),    # avg > 2.1 = 93% confident
+    (2.5, 84, 1.67, True, 0.6),    # avg > 3.1 = 84% confident
+    (3.5, 71, 2.40, True, 0.6),    # avg > 4.1 = 71% confident
+    
+    # UNDERS
+    (4.5, 91, 1.33, False, -1.0),  # avg < 3.5 = 91% confident
+    (3.5, 82, 1.67, False, -0.6),  # avg < 2.9 = 82% confident
+    (2.5, 68, 2.20, False, -0.4),  # avg < 2.1 = 68% confident
+)
+
+
+def _by_confidence(options: tuple) -> tuple:
+    """
+    Order options by descending confidence (stable, so earlier lines win ties)
+    
+    Each row is extended with its precomputed direction label and selection
+    string, e.g. ('Over', 'Over 8.5'), so predict calls don't rebuild them
+    """
+    ordered = sorted(options, key=lambda option: -option[1])
+    rows = []
+    for line, base_conf, odds, is_over, buffer in ordered:
+        direction = 'Over' if is_over else 'Under'
+        rows.append((line, base_conf, odds, is_over, buffer, direction, f'{direction} {line}'))
+    return tuple(rows)
+
+
+_CORNER_OPTIONS = _by_confidence(_CORNER_OPTIONS)
+_CARD_OPTIONS = _by_confidence(_CARD_OPTIONS)
+_GOAL_OPTIONS = _by_confidence(_GOAL_OPTIONS)
+
+_confidence_key = itemgetter('confidence')
+
+# Category labels shared by every prediction dict
+_ULTRA_SAFE = sys.intern('ultra_safe')
+_SAFE = sys.intern('safe')
+_RISKY = sys.intern('risky')
+_TOO_RISKY = sys.intern('too_risky')
+
+
+def _best_option(value: float, options: tuple) -> Optional[tuple]:
+    """Return the highest confidence option whose line + buffer the value clears"""
+    for option in options:
+        line, _, _, is_over, buffer, _, _ = option
+        if is_over:
+            if value > (line + buffer):
+                return option
+        elif value < (line + buffer):
+            return option
+    return None
+
+
 class BetPredictor:
     """
     Generates betting predictions for markets actually offered by bet365
@@ -13,9 +108,51 @@ class BetPredictor:
     """
     
     def __init__(self):
-        self.ultra_safe_threshold = 90
-        self.safe_threshold = 75
-        self.risky_threshold = 60
+        self._ultra_safe_threshold = 90
+        self._safe_threshold = 75
+        self._risky_threshold = 60
+        self._build_category_table()
+    
+    @property
+    def ultra_safe_threshold(self):
+        return self._ultra_safe_threshold
+    
+    @ultra_safe_threshold.setter
+    def ultra_safe_threshold(self, value):
+        self._ultra_safe_threshold = value
+        self._build_category_table()
+    
+    @property
+    def safe_threshold(self):
+        return self._safe_threshold
+    
+    @safe_threshold.setter
+    def safe_threshold(self, value):
+        self._safe_threshold = value
+        self._build_category_table()
+    
+    @property
+    def risky_threshold(self):
+        return self._risky_threshold
+    
+    @risky_threshold.setter
+    def risky_threshold(self, value):
+        self._risky_threshold = value
+        self._build_category_table()
+    
+    def _build_category_table(self):
+        """Integer confidence (0-100) -> category, rebuilt whenever a threshold changes"""
+        self._category_table = tuple(self._categorize(c) for c in range(101))
+    
+    def _categorize(self, confidence: float) -> str:
+        """Compare a confidence against the thresholds"""
+        if confidence >= self._ultra_safe_threshold:
+            return _ULTRA_SAFE
+        if confidence >= self._safe_threshold:
+            return _SAFE
+        if confidence >= self._risky_threshold:
+            return _RISKY
+        return _TOO_RISKY
     
     def predict_match_corners(self, home_avg: float, away_avg: float, 
                              matches_played: int, h2h_avg: Optional[float] = None) -> List[Dict]:
@@ -29,55 +166,9 @@ class BetPredictor:
         match_avg = home_avg + away_avg
         
         # Find best line in the "sweet spot"
-        best_prediction = None
-        best_confidence = 0
-        
-        # (line, base_conf, odds, direction, buffer_needed)
-        # Sweet spot: lines between 5.5 and 11.5 corners
-        options = [
-            # OVERS - sweet spot for value
-            (5.5, 96, 1.15, 'over', 2.5),   # avg > 8.0 = 96% confident
-            (6.5, 94, 1.25, 'over', 2.0),   # avg > 8.5 = 94% confident
-            (7.5, 91, 1.40, 'over', 2.0),   # avg > 9.5 = 91% confident
-            (8.5, 88, 1.50, 'over', 1.5),   # avg > 10.0 = 88% confident
-            (9.5, 84, 1.70, 'over', 1.5),   # avg > 11.0 = 84% confident
-            (10.5, 79, 1.90, 'over', 1.5),  # avg > 12.0 = 79% confident
-            (11.5, 73, 2.10, 'over', 1.5),  # avg > 13.0 = 73% confident
-            
-            # UNDERS - for low-scoring matches
-            (13.5, 91, 1.40, 'under', -2.0), # avg < 11.5 = 91% confident
-            (12.5, 86, 1.60, 'under', -1.5), # avg < 11.0 = 86% confident
-            (11.5, 80, 1.83, 'under', -1.5), # avg < 10.0 = 80% confident
-        ]
-        
-        for line, base_conf, odds, direction, buffer in options:
-            if direction == 'over':
-                if match_avg > (line + buffer):
-                    confidence = base_conf
-                else:
-                    continue
-            else:
-                if match_avg < (line + buffer):
-                    confidence = base_conf
-                else:
-                    continue
-            
-            # Take the highest confidence option
-            if confidence > best_confidence:
-                best_confidence = confidence
-                best_prediction = {
-                    'market': f'Match {direction.title()} {line} Corners',
-                    'selection': f'{direction.title()} {line}',
-                    'line': line,
-                    'confidence': confidence,
-                    'avg': match_avg,
-                    'odds': odds,
-                    'category': self._get_category(confidence),
-                    'bet365_market': 'Corners',
-                    'type': 'match'
-                }
-        
-        return [best_prediction] if best_prediction else []
+        prediction = self._predict_over_under(match_avg, _CORNER_OPTIONS, 'Match {direction} {line} Corners',
+                                              'Corners', 'avg', match_avg)
+        return [prediction] if prediction else []
     
     def predict_match_cards(self, home_avg: float, away_avg: float, 
                            matches_played: int) -> List[Dict]:
@@ -90,50 +181,40 @@ class BetPredictor:
         
         match_avg = home_avg + away_avg
         
-        best_prediction = None
-        best_confidence = 0
+        prediction = self._predict_over_under(match_avg, _CARD_OPTIONS, 'Match {direction} {line} Cards',
+                                              'Cards', 'avg', match_avg)
+        return [prediction] if prediction else []
+    
+    def _predict_over_under(self, value: float, options: tuple, market_template: str,
+                            bet365_market: str, extra_key: str, extra_value: float) -> Optional[Dict]:
+        """
+        Shared core for the over/under match markets
+        
+        Args:
+            value: Match average / expected total compared against each line
+            options: Confidence-ordered line table (see _by_confidence)
+            market_template: Market name with {direction} and {line} placeholders
+            bet365_market: bet365 market name
+            extra_key: Name of the stat field ('avg' or 'expected')
+            extra_value: Value stored under extra_key
+        """
+        best = _best_option(value, options)
+        if not best:
+            return None
         
-        # Sweet spot: lines between 1.5 and 5.5 cards
-        options = [
-            # OVERS
-            (1.5, 96, 1.10, 'over', 1.0),   # avg > 2.5 = 96% confident
-            (2.5, 92, 1.40, 'over', 0.8),   # avg > 3.3 = 92% confident
-            (3.5, 87, 1.75, 'over', 0.7),   # avg > 4.2 = 87% confident
-            (4.5, 79, 2.00, 'over', 0.7),   # avg > 5.2 = 79% confident
-            (5.5, 70, 2.40, 'over', 0.7),   # avg > 6.2 = 70% confident
-            
-            # UNDERS
-            (6.5, 91, 1.40, 'under', -1.0), # avg < 5.5 = 91% confident
-            (5.5, 84, 1.70, 'under', -0.7), # avg < 4.8 = 84% confident
-        ]
+        line, confidence, odds, _, _, direction, selection = best
         
-        for line, base_conf, odds, direction, buffer in options:
-            if direction == 'over':
-                if match_avg > (line + buffer):
-                    confidence = base_conf
-                else:
-                    continue
-            else:
-                if match_avg < (line + buffer):
-                    confidence = base_conf
-                else:
-                    continue
-            
-            if confidence > best_confidence:
-                best_confidence = confidence
-                best_prediction = {
-                    'market': f'Match {direction.title()} {line} Cards',
-                    'selection': f'{direction.title()} {line}',
-                    'line': line,
-                    'confidence': confidence,
-                    'avg': match_avg,
-                    'odds': odds,
-                    'category': self._get_category(confidence),
-                    'bet365_market': 'Cards',
-                    'type': 'match'
-                }
-        
-        return [best_prediction] if best_prediction else []
+        return {
+            'market': market_template.format(direction=direction, line=line),
+            'selection': selection,
+            'line': line,
+            'confidence': confidence,
+            extra_key: extra_value,
+            'odds': odds,
+            'category': self._get_category(confidence),
+            'bet365_market': bet365_market,
+            'type': 'match'
+        }
     
     def predict_match_goals(self, expected_goals: float, btts_pct_avg: float, 
                            matches_played: int) -> List[Dict]:
@@ -146,79 +227,35 @@ class BetPredictor:
         predictions = []
         
         # Find best over/under line
-        best_prediction = None
-        best_confidence = 0
-        
-        # Sweet spot: lines between 1.5 and 3.5 goals
-        options = [
-            # OVERS
-            (1.5, 93, 1.25, 'over', 0.6),   # avg > 2.1 = 93% confident
-            (2.5, 84, 1.67, 'over', 0.6),   # avg > 3.1 = 84% confident
-            (3.5, 71, 2.40, 'over', 0.6),   # avg > 4.1 = 71% confident
-            
-            # UNDERS
-            (4.5, 91, 1.33, 'under', -1.0), # avg < 3.5 = 91% confident
-            (3.5, 82, 1.67, 'under', -0.6), # avg < 2.9 = 82% confident
-            (2.5, 68, 2.20, 'under', -0.4), # avg < 2.1 = 68% confident
-        ]
-        
-        for line, base_conf, odds, direction, buffer in options:
-            if direction == 'over':
-                if expected_goals > (line + buffer):
-                    confidence = base_conf
-                else:
-                    continue
-            else:
-                if expected_goals < (line + buffer):
-                    confidence = base_conf
-                else:
-                    continue
-            
-            if confidence > best_confidence:
-                best_confidence = confidence
-                best_prediction = {
-                    'market': f'{direction.title()} {line} Goals',
-                    'selection': f'{direction.title()} {line}',
-                    'line': line,
-                    'confidence': confidence,
-                    'expected': round(expected_goals, 1),
-                    'odds': odds,
-                    'category': self._get_category(confidence),
-                    'bet365_market': 'Goals Over/Under',
-                    'type': 'match'
-                }
-        
-        if best_prediction:
-            predictions.append(best_prediction)
+        prediction = self._predict_over_under(expected_goals, _GOAL_OPTIONS, '{direction} {line} Goals',
+                                              'Goals Over/Under', 'expected', round(expected_goals, 1))
+        if prediction:
+            predictions.append(prediction)
         
         # BTTS - separate prediction
         if btts_pct_avg > 65:
             confidence = min(int(btts_pct_avg * 1.30), 95)
-            predictions.append({
-                'market': 'Both Teams To Score - Yes',
-                'selection': 'Yes',
-                'confidence': confidence,
-                'btts_pct': round(btts_pct_avg, 1),
-                'odds': 1.70,
-                'category': self._get_category(confidence),
-                'bet365_market': 'Both Teams To Score',
-                'type': 'match'
-            })
+            predictions.append(self._make_btts_prediction('Yes', confidence, btts_pct_avg, 1.70))
         elif btts_pct_avg < 35:
             confidence = min(int((100 - btts_pct_avg) * 1.35), 95)
-            predictions.append({
-                'market': 'Both Teams To Score - No',
-                'selection': 'No',
-                'confidence': confidence,
-                'btts_pct': round(btts_pct_avg, 1),
-                'odds': 2.00,
-                'category': self._get_category(confidence),
-                'bet365_market': 'Both Teams To Score',
-                'type': 'match'
-            })
+            predictions.append(self._make_btts_prediction('No', confidence, btts_pct_avg, 2.00))
         
         return predictions
     
+    def _make_btts_prediction(self, selection: str, confidence: int,
+                              btts_pct_avg: float, odds: float) -> Dict:
+        """Build a BTTS prediction dict (single construction site keeps key order fixed)"""
+        return {
+            'market': f'Both Teams To Score - {selection}',
+            'selection': selection,
+            'confidence': confidence,
+            'btts_pct': round(btts_pct_avg, 1),
+            'odds': odds,
+            'category': self._get_category(confidence),
+            'bet365_market': 'Both Teams To Score',
+            'type': 'match'
+        }
+    
     def predict_player_card(self, player_name: str, cards_per_90: float, 
                           minutes: int, position: str) -> Optional[Dict]:
         """Predict player to be booked - PLAYER PROP"""
@@ -314,16 +351,13 @@ class BetPredictor:
             'type': 'player'
         }
     
-    def _get_category(self, confidence: int) -> str:
+    def _get_category(self, confidence: float) -> str:
         """Get confidence category"""
-        if confidence >= self.ultra_safe_threshold:
-            return 'ultra_safe'
-        elif confidence >= self.safe_threshold:
-            return 'safe'
-        elif confidence >= self.risky_threshold:
-            return 'risky'
-        else:
-            return 'too_risky'
+        # Integer confidences in range are a single table index; anything
+        # else (fractional, out of range) is compared directly
+        if type(confidence) is int and 0 <= confidence <= 100:
+            return self._category_table[confidence]
+        return self._categorize(confidence)
     
     def generate_bet_builders(self, all_predictions: Dict) -> List[Dict]:
         """
@@ -340,60 +374,51 @@ class BetPredictor:
         risky = [p for p in all_predictions.get('risky', []) 
                 if p.get('type') == 'match']
         
+        # Only the top 1-2 of each tier are ever used, so skip full sorts
+        top_ultra = heapq.nlargest(2, ultra_safe, key=_confidence_key)
+        top_safe = heapq.nlargest(1, safe, key=_confidence_key)
+        top_risky = heapq.nlargest(1, risky, key=_confidence_key)
+        
         # Evens builder - 2 ultra safe
-        if len(ultra_safe) >= 2:
-            sorted_ultra = sorted(ultra_safe, key=lambda x: x['confidence'], reverse=True)
-            bet1, bet2 = sorted_ultra[0], sorted_ultra[1]
-            
-            combined_odds = bet1['odds'] * bet2['odds']
+        if len(top_ultra) >= 2:
+            selections = [top_ultra[0], top_ultra[1]]
+            combined_odds = math.prod(bet['odds'] for bet in selections)
             
             if 1.8 <= combined_odds <= 2.5:
                 builders.append({
                     'name': 'EVENS BUILDER',
                     'target_odds': '1.8-2.2',
-                    'selections': [bet1, bet2],
+                    'selections': selections,
                     'combined_odds': round(combined_odds, 2),
-                    'min_confidence': min(bet1['confidence'], bet2['confidence'])
+                    'min_confidence': min(bet['confidence'] for bet in selections)
                 })
         
         # 2/1 builder - 2 ultra safe + 1 safe
-        if len(ultra_safe) >= 2 and len(safe) >= 1:
-            sorted_ultra = sorted(ultra_safe, key=lambda x: x['confidence'], reverse=True)
-            sorted_safe = sorted(safe, key=lambda x: x['confidence'], reverse=True)
-            
-            bet1, bet2 = sorted_ultra[0], sorted_ultra[1]
-            bet3 = sorted_safe[0]
-            
-            combined_odds = bet1['odds'] * bet2['odds'] * bet3['odds']
+        if len(top_ultra) >= 2 and top_safe:
+            selections = [top_ultra[0], top_ultra[1], top_safe[0]]
+            combined_odds = math.prod(bet['odds'] for bet in selections)
             
             if 2.5 <= combined_odds <= 4.0:
                 builders.append({
                     'name': '2/1 BUILDER',
                     'target_odds': '2.5-3.5',
-                    'selections': [bet1, bet2, bet3],
+                    'selections': selections,
                     'combined_odds': round(combined_odds, 2),
-                    'min_confidence': min(bet1['confidence'], bet2['confidence'], bet3['confidence'])
+                    'min_confidence': min(bet['confidence'] for bet in selections)
                 })
         
         # 3/1 builder - 1 ultra + 1 safe + 1 risky
-        if len(ultra_safe) >= 1 and len(safe) >= 1 and len(risky) >= 1:
-            sorted_ultra = sorted(ultra_safe, key=lambda x: x['confidence'], reverse=True)
-            sorted_safe = sorted(safe, key=lambda x: x['confidence'], reverse=True)
-            sorted_risky = sorted(risky, key=lambda x: x['confidence'], reverse=True)
-            
-            bet1 = sorted_ultra[0]
-            bet2 = sorted_safe[0]
-            bet3 = sorted_risky[0]
-            
-            combined_odds = bet1['odds'] * bet2['odds'] * bet3['odds']
+        if top_ultra and top_safe and top_risky:
+            selections = [top_ultra[0], top_safe[0], top_risky[0]]
+            combined_odds = math.prod(bet['odds'] for bet in selections)
             
             if 3.5 <= combined_odds <= 5.5:
                 builders.append({
                     'name': '3/1 BUILDER',
                     'target_odds': '3.5-4.5',
-                    'selections': [bet1, bet2, bet3],
+                    'selections': selections,
                     'combined_odds': round(combined_odds, 2),
-                    'min_confidence': min(bet1['confidence'], bet2['confidence'], bet3['confidence'])
+                    'min_confidence': min(bet['confidence'] for bet in selections)
                 })
         
         return builders
\ No newline at end of file
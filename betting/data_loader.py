@@ -4,17 +4,119 @@ Loads match details, league tables, team fixtures, and player data
 """
 
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple, Union
+
+# orjson parses several times faster when available; stdlib json otherwise
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+
+def _list_json_files(directory: Path) -> List[str]:
+    """List paths of *.json files in a directory (scandir avoids per-entry Path/fnmatch work)"""
+    with os.scandir(directory) as entries:
+        return [entry.path for entry in entries if entry.name.endswith('.json')]
+
+
+def _stat_json_files(directory: Path) -> Dict[str, Tuple[int, int]]:
+    """{path: (mtime_ns, size)} of *.json files in a directory, from one scandir"""
+    stamps = {}
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if not entry.name.endswith('.json'):
+                continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            stamps[entry.path] = (stat.st_mtime_ns, stat.st_size)
+    return stamps
+
+
+def _read_json_file(path: Union[str, Path]) -> Optional[Dict]:
+    """Read and parse a single JSON file, returning None on failure"""
+    try:
+        with open(path, 'rb') as f:
+            return json_loads(f.read())
+    except Exception as e:
+        print(f"Error loading {path}: {e}")
+        return None
+
+
+# Match fields consumers compare/sort numerically
+_INT_FIELDS = ('homeID', 'awayID')
+
+_by_date = itemgetter('date_unix')
+
+
+def _normalize_match(match: Dict) -> Dict:
+    """
+    Coerce id/timestamp fields to int in place, so consumers can skip int()
+    casts; date_unix is always present afterwards (0 when missing/unusable)
+    so matches can be sorted with itemgetter('date_unix')
+    """
+    for field in _INT_FIELDS:
+        value = match.get(field)
+        if value is not None and type(value) is not int:
+            try:
+                match[field] = int(value)
+            except (TypeError, ValueError):
+                pass
+    
+    ts = match.get('date_unix')
+    if type(ts) is not int:
+        try:
+            match['date_unix'] = int(ts) if ts else 0
+        except (TypeError, ValueError):
+            match['date_unix'] = 0
+    return match
+
+
+def _peek_match(path: str) -> Optional[Tuple[int, str]]:
+    """
+    Read just (game_week, status) from a match summary file
+    
+    Match summaries are small flat objects, so a single parse of the
+    raw bytes is cheaper than streaming; unreadable files are skipped (None)
+    """
+    try:
+        with open(path, 'rb') as f:
+            match = json_loads(f.read())
+        gw = match.get('game_week', 0)
+    except Exception:
+        return None
+    
+    # Non-numeric gameweeks can't be compared, so treat them as unreadable too
+    if not isinstance(gw, (int, float)):
+        return None
+    
+    return gw, match.get('status', '')
 
 
 class DataLoader:
     """Loads football data from ingested files"""
     
+    # Written by ingestion's DataManager.write_gameweek_summary
+    GAMEWEEK_SUMMARY_FILE = "_gameweek_summary.json"
+    
     def __init__(self, data_dir: str = "./data"):
         self.data_dir = Path(data_dir)
         self.leagues_dir = self.data_dir / "leagues"
         self.teams_dir = self.data_dir / "teams"
+        
+        # (league_key, season_id) -> (match_details dir mtime, {match_id: path})
+        self._details_index: Dict[Tuple[str, int], Tuple[int, Dict[int, Path]]] = {}
+        
+        # (teams dir mtime, {team_id: team dir})
+        self._team_index: Optional[Tuple[int, Dict[int, Path]]] = None
+        
+        # (league_key, season_id) -> ({path: (mtime_ns, size)}, {path: match}, matches sorted by date)
+        self._matches_cache: Dict[Tuple[str, int], Tuple[Dict[str, Tuple[int, int]], Dict[str, Dict], List[Dict]]] = {}
     
     def get_available_leagues(self) -> List[Dict]:
         """
@@ -52,36 +154,9 @@ class DataLoader:
                 except:
                     pass
             
-            matches_dir = league_dir / "matches"
-            max_gameweek = 0
-            completed_gameweeks = 0
-            next_gameweek = None
-            
-            if matches_dir.exists():
-                gameweeks_with_incomplete = set()
-                
-                for match_file in matches_dir.glob("*.json"):
-                    try:
-                        with open(match_file, 'r') as f:
-                            match = json.load(f)
-                            gw = match.get('game_week', 0)
-                            status = match.get('status', '')
-                            
-                            if gw > max_gameweek:
-                                max_gameweek = gw
-                            
-                            if status == 'complete':
-                                completed_gameweeks = max(completed_gameweeks, gw)
-                            
-                            if status in ['incomplete', 'fixture']:
-                                gameweeks_with_incomplete.add(gw)
-                    except:
-                        continue
-                
-                if gameweeks_with_incomplete:
-                    next_gameweek = min(gameweeks_with_incomplete)
-                else:
-                    next_gameweek = completed_gameweeks + 1
+            summary = self._get_gameweek_summary(league_dir)
+            max_gameweek = summary['max_gameweek']
+            next_gameweek = summary['next_gameweek']
             
             leagues.append({
                 'name': league_name,
@@ -89,7 +164,7 @@ class DataLoader:
                 'season_id': season_id,
                 'path': str(league_dir),
                 'max_gameweek': max_gameweek,
-                'completed_gameweeks': completed_gameweeks,
+                'completed_gameweeks': summary['completed_gameweeks'],
                 'next_gameweek': next_gameweek if next_gameweek else max_gameweek
             })
         
@@ -102,30 +177,72 @@ class DataLoader:
         Returns:
             Next gameweek number
         """
-        all_matches = self.load_all_matches(league_key, season_id)
+        league_dir = self.leagues_dir / f"{league_key}_{season_id}"
+        next_gameweek = self._get_gameweek_summary(league_dir)['next_gameweek']
+        
+        return next_gameweek if next_gameweek is not None else 1
+    
+    def _get_gameweek_summary(self, league_dir: Path) -> Dict:
+        """
+        Get gameweek summary for a league directory
+        
+        Read from the summary ingestion writes after saving matches (it drops
+        the file whenever a match is saved, so in-place status updates are
+        picked up too); scanned from the match files when it is missing or
+        the matches directory changed since
         
-        if not all_matches:
-            return 1
+        Returns:
+            Dict with max_gameweek, completed_gameweeks, next_gameweek
+        """
+        matches_dir = league_dir / "matches"
+        
+        try:
+            mtime = matches_dir.stat().st_mtime_ns
+        except OSError:
+            return {'max_gameweek': 0, 'completed_gameweeks': 0, 'next_gameweek': None}
+        
+        summary_file = league_dir / self.GAMEWEEK_SUMMARY_FILE
+        try:
+            with open(summary_file, 'rb') as f:
+                cached = json_loads(f.read())
+            if cached.get('mtime') == mtime:
+                return cached
+        except (OSError, ValueError):
+            pass
+        
+        max_gameweek = 0
+        completed_gameweeks = 0
+        gameweeks_with_incomplete = set()
         
-        incomplete_gameweeks = set()
-        completed_gameweeks = set()
+        with ThreadPoolExecutor() as pool:
+            peeked = list(pool.map(_peek_match, _list_json_files(matches_dir)))
         
-        for match in all_matches:
-            gw = match.get('game_week', 0)
-            status = match.get('status', '')
+        for gw_status in peeked:
+            if gw_status is None:
+                continue
+            
+            gw, status = gw_status
+            
+            if gw > max_gameweek:
+                max_gameweek = gw
             
             if status == 'complete':
-                completed_gameweeks.add(gw)
-            elif status in ['incomplete', 'fixture']:
-                incomplete_gameweeks.add(gw)
-        
-        if incomplete_gameweeks:
-            return min(incomplete_gameweeks)
+                completed_gameweeks = max(completed_gameweeks, gw)
+            
+            if status in ['incomplete', 'fixture']:
+                gameweeks_with_incomplete.add(gw)
         
-        if completed_gameweeks:
-            return max(completed_gameweeks) + 1
+        if gameweeks_with_incomplete:
+            next_gameweek = min(gameweeks_with_incomplete)
+        else:
+            next_gameweek = completed_gameweeks + 1
         
-        return 1
+        return {
+            'mtime': mtime,
+            'max_gameweek': max_gameweek,
+            'completed_gameweeks': completed_gameweeks,
+            'next_gameweek': next_gameweek
+        }
     
     def load_league_table(self, league_key: str, season_id: int) -> Optional[Dict]:
         """Load league table"""
@@ -136,40 +253,89 @@ class DataLoader:
             return None
         
         try:
-            with open(table_file, 'r') as f:
-                return json.load(f)
+            return json_loads(table_file.read_bytes())
         except Exception as e:
             print(f"Error loading league table: {e}")
             return None
     
     def load_all_matches(self, league_key: str, season_id: int) -> List[Dict]:
-        """Load all matches for a league/season"""
+        """
+        Load all matches for a league/season
+        
+        Each file is parsed once and reused while it keeps the mtime/size it
+        had when read, so files rewritten in place (status/score updates)
+        are re-read on the next call. Returns a fresh list each call so
+        callers can reorder/filter it, but the match dicts themselves are
+        shared between calls and must be treated as read-only.
+        """
         league_dir = self.leagues_dir / f"{league_key}_{season_id}"
         matches_dir = league_dir / "matches"
         
-        if not matches_dir.exists():
+        try:
+            stamps = _stat_json_files(matches_dir)
+        except OSError:
             return []
         
-        matches = []
-        for match_file in matches_dir.glob("*.json"):
-            try:
-                with open(match_file, 'r') as f:
-                    match = json.load(f)
-                    matches.append(match)
-            except Exception as e:
-                print(f"Error loading match {match_file}: {e}")
-                continue
+        key = (league_key, season_id)
+        cached_stamps, cached_by_path, cached_matches = self._matches_cache.get(key, ({}, {}, []))
+        if stamps == cached_stamps:
+            return list(cached_matches)
+        
+        by_path = {
+            path: cached_by_path[path]
+            for path, stamp in stamps.items()
+            if cached_stamps.get(path) == stamp and path in cached_by_path
+        }
+        to_read = [path for path in stamps if path not in by_path]
+        
+        # Reads are I/O bound, so overlap them across a thread pool
+        with ThreadPoolExecutor() as pool:
+            for path, match in zip(to_read, pool.map(_read_json_file, to_read)):
+                if match is not None:
+                    by_path[path] = _normalize_match(match)
+        
+        matches = sorted((by_path[path] for path in stamps if path in by_path), key=_by_date)
+        
+        self._matches_cache[key] = (stamps, by_path, matches)
+        return list(matches)
+    
+    def _get_details_index(self, league_key: str, season_id: int) -> Dict[int, Path]:
+        """
+        Get {match_id: path} index of match details files for a league/season
+        
+        Built with a single directory scan and reused until the
+        match_details dir mtime changes
+        """
+        details_dir = self.leagues_dir / f"{league_key}_{season_id}" / "match_details"
+        
+        try:
+            mtime = details_dir.stat().st_mtime_ns
+        except OSError:
+            return {}
+        
+        key = (league_key, season_id)
+        cached = self._details_index.get(key)
+        if cached and cached[0] == mtime:
+            return cached[1]
         
-        matches.sort(key=lambda x: x.get('date_unix', 0))
+        index = {}
+        with os.scandir(details_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith('.json'):
+                    continue
+                try:
+                    index[int(entry.name[:-5])] = Path(entry.path)
+                except ValueError:
+                    continue
         
-        return matches
+        self._details_index[key] = (mtime, index)
+        return index
     
     def load_match_details(self, league_key: str, season_id: int, match_id: int) -> Optional[Dict]:
         """Load detailed match data"""
-        league_dir = self.leagues_dir / f"{league_key}_{season_id}"
-        details_file = league_dir / "match_details" / f"{match_id}.json"
+        details_file = self._get_details_index(league_key, season_id).get(match_id)
         
-        if not details_file.exists():
+        if details_file is None:
             return None
         
         try:
@@ -186,23 +352,48 @@ class DataLoader:
         Returns:
             Dict mapping match_id to match details
         """
-        league_dir = self.leagues_dir / f"{league_key}_{season_id}"
-        details_dir = league_dir / "match_details"
+        index = self._get_details_index(league_key, season_id)
+        
+        with ThreadPoolExecutor() as pool:
+            loaded = pool.map(_read_json_file, index.values())
+            return {
+                match_id: details
+                for match_id, details in zip(index.keys(), loaded)
+                if details is not None
+            }
+    
+    def _get_team_index(self) -> Dict[int, Path]:
+        """
+        Get {team_id: team dir} index of aggregated teams
         
-        if not details_dir.exists():
+        Reads every team_info.json once and reuses the result until
+        the teams dir mtime changes
+        """
+        try:
+            mtime = self.teams_dir.stat().st_mtime_ns
+        except OSError:
             return {}
         
-        match_details = {}
-        for details_file in details_dir.glob("*.json"):
+        if self._team_index and self._team_index[0] == mtime:
+            return self._team_index[1]
+        
+        index = {}
+        for team_dir in self.teams_dir.iterdir():
+            if not team_dir.is_dir():
+                continue
+            
             try:
-                match_id = int(details_file.stem)
-                with open(details_file, 'r') as f:
-                    match_details[match_id] = json.load(f)
-            except Exception as e:
-                print(f"Error loading match details {details_file}: {e}")
+                with open(team_dir / "team_info.json", 'r') as f:
+                    info = json.load(f)
+            except:
                 continue
+            
+            team_id = info.get('team_id')
+            if team_id is not None and team_id not in index:
+                index[team_id] = team_dir
         
-        return match_details
+        self._team_index = (mtime, index)
+        return index
     
     def load_team_fixtures(self, team_id: int) -> Optional[Dict]:
         """
@@ -211,27 +402,19 @@ class DataLoader:
         Returns:
             Dict with all_fixtures data or None if not found
         """
-        if not self.teams_dir.exists():
+        team_dir = self._get_team_index().get(team_id)
+        if team_dir is None:
             return None
         
-        for team_dir in self.teams_dir.iterdir():
-            if not team_dir.is_dir():
-                continue
-            
-            team_info_file = team_dir / "team_info.json"
-            if team_info_file.exists():
-                try:
-                    with open(team_info_file, 'r') as f:
-                        info = json.load(f)
-                        if info.get('team_id') == team_id:
-                            fixtures_file = team_dir / "all_fixtures.json"
-                            if fixtures_file.exists():
-                                with open(fixtures_file, 'r') as f:
-                                    return json.load(f)
-                except:
-                    continue
+        fixtures_file = team_dir / "all_fixtures.json"
+        if not fixtures_file.exists():
+            return None
         
-        return None
+        try:
+            with open(fixtures_file, 'r') as f:
+                return json.load(f)
+        except:
+            return None
     
     def load_team_players(self, league_key: str, season_id: int, team_id: int) -> List[Dict]:
         """
@@ -246,7 +429,7 @@ class DataLoader:
                 continue
             
             players = []
-            for player_file in players_dir.glob("*.json"):
+            for player_file in _list_json_files(players_dir):
                 try:
                     with open(player_file, 'r') as f:
                         player = json.load(f)
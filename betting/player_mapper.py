@@ -3,7 +3,15 @@ Player Mapper
 Maps player IDs to player names for validation
 """
 
-from typing import Dict, Optional, List
+from collections import defaultdict
+from typing import Dict, Optional, List, Tuple
+
+
+def _split_name(name: str) -> Tuple[str, str]:
+    """Return (lowercased name, lowercased last name)"""
+    name_lower = name.lower()
+    parts = name_lower.split()
+    return name_lower, parts[-1] if parts else ''
 
 
 class PlayerMapper:
@@ -26,6 +34,23 @@ class PlayerMapper:
             
             if player_id and name:
                 self.player_map[player_id] = name
+        
+        # Normalize names once so lookups don't re-lowercase/split per call
+        self._name_keys: Dict[int, Tuple[str, str]] = {}
+        
+        # Reverse indexes for find_player_id: full name, last name, any name token
+        self._exact: Dict[str, int] = {}
+        self._by_last_name: Dict[str, List[int]] = defaultdict(list)
+        self._by_token: Dict[str, List[int]] = defaultdict(list)
+        
+        for player_id, name in self.player_map.items():
+            name_lower, last_name = _split_name(name)
+            self._name_keys[player_id] = (name_lower, last_name)
+            self._exact.setdefault(name_lower, player_id)
+            if last_name:
+                self._by_last_name[last_name].append(player_id)
+            for token in set(name_lower.split()):
+                self._by_token[token].append(player_id)
     
     def get_name(self, player_id: int) -> Optional[str]:
         """Get player name from ID"""
@@ -38,14 +63,17 @@ class PlayerMapper:
         Uses fuzzy matching since names might differ slightly
         (e.g., "Mohamed Salah" vs "M. Salah" vs "Salah")
         """
-        actual_name = self.get_name(player_id)
+        target_lower, target_last = _split_name(target_name)
+        return self._matches_normalized(player_id, target_lower, target_last)
+    
+    def _matches_normalized(self, player_id: int, target_lower: str, target_last: str) -> bool:
+        """matches_name against an already normalized target"""
+        name_keys = self._name_keys.get(player_id)
         
-        if not actual_name:
+        if not name_keys:
             return False
         
-        # Normalize both names
-        actual_lower = actual_name.lower()
-        target_lower = target_name.lower()
+        actual_lower, actual_last = name_keys
         
         # Exact match
         if actual_lower == target_lower:
@@ -56,14 +84,9 @@ class PlayerMapper:
         if target_lower in actual_lower or actual_lower in target_lower:
             return True
         
-        # Check last name matching
-        actual_parts = actual_lower.split()
-        target_parts = target_lower.split()
-        
-        if actual_parts and target_parts:
-            # If last names match, consider it a match
-            if actual_parts[-1] == target_parts[-1]:
-                return True
+        # If last names match, consider it a match
+        if actual_last and target_last and actual_last == target_last:
+            return True
         
         return False
     
@@ -71,8 +94,20 @@ class PlayerMapper:
         """
         Find player ID by name (reverse lookup)
         """
-        for player_id, name in self.player_map.items():
-            if self.matches_name(player_id, player_name):
+        target_lower, target_last = _split_name(player_name)
+        
+        # Probe the reverse indexes first - each hit is a guaranteed match
+        player_id = self._exact.get(target_lower)
+        if player_id is not None:
+            return player_id
+        
+        candidates = self._by_last_name.get(target_last) or self._by_token.get(target_lower)
+        if candidates:
+            return candidates[0]
+        
+        # Fall back to fuzzy matching (initials, partial names, etc.)
+        for player_id in self.player_map:
+            if self._matches_normalized(player_id, target_lower, target_last):
                 return player_id
         
         return None
\ No newline at end of file
@@ -3,14 +3,151 @@ Stat Calculator
 Calculates team and player statistics with proper filtering for backtesting
 """
 
-from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Tuple
 from .utils import (
-    get_team_stats, get_opponent_stats, is_home_team, 
-    filter_matches_before_gameweek, is_completed_match,
-    get_team_goals, safe_divide
+    is_home_team, is_completed_match, get_gameweek,
+    get_team_goals, raw_divide
 )
 
 
+# (stat name, key when team is home, key when team is away, only count positive values)
+_STAT_COLUMNS = (
+    ('corners', 'team_a_corners', 'team_b_corners', False),
+    ('corners_1h', 'team_a_fh_corners', 'team_b_fh_corners', False),
+    ('corners_2h', 'team_a_2h_corners', 'team_b_2h_corners', False),
+    ('shots', 'team_a_shots', 'team_b_shots', False),
+    ('shots_on_target', 'team_a_shotsOnTarget', 'team_b_shotsOnTarget', False),
+    ('shots_off_target', 'team_a_shotsOffTarget', 'team_b_shotsOffTarget', False),
+    ('cards', 'team_a_cards_num', 'team_b_cards_num', False),
+    ('yellow_cards', 'team_a_yellow_cards', 'team_b_yellow_cards', False),
+    ('red_cards', 'team_a_red_cards', 'team_b_red_cards', False),
+    ('fouls', 'team_a_fouls', 'team_b_fouls', False),
+    ('possession', 'team_a_possession', 'team_b_possession', False),
+    ('offsides', 'team_a_offsides', 'team_b_offsides', False),
+    # xG / attacks are optional - missing or placeholder values are skipped
+    ('xg', 'team_a_xg', 'team_b_xg', True),
+    ('attacks', 'team_a_attacks', 'team_b_attacks', True),
+    ('dangerous_attacks', 'team_a_dangerous_attacks', 'team_b_dangerous_attacks', True),
+    ('goals_scored', 'homeGoalCount', 'awayGoalCount', False),
+    ('goals_conceded', 'awayGoalCount', 'homeGoalCount', False),
+    ('goals_1h_scored', 'ht_goals_team_a', 'ht_goals_team_b', False),
+    ('goals_1h_conceded', 'ht_goals_team_b', 'ht_goals_team_a', False),
+)
+
+_COLUMN_NAMES = tuple(name for name, _, _, _ in _STAT_COLUMNS)
+_HOME_KEYS = tuple(home_key for _, home_key, _, _ in _STAT_COLUMNS)
+_AWAY_KEYS = tuple(away_key for _, _, away_key, _ in _STAT_COLUMNS)
+_DEFAULTS = (0,) * len(_STAT_COLUMNS)
+_POSITIVE_ONLY = tuple(name for name, _, _, positive_only in _STAT_COLUMNS if positive_only)
+
+
+def _matches_to_columns(fixtures: List[Dict], home_flags: List[bool]) -> Dict[str, List]:
+    """
+    Extract a team's per-match stats into columns (one list per stat)
+    
+    Args:
+        fixtures: Team fixtures
+        home_flags: Whether the team was home in each fixture (same order)
+    """
+    # One C-level map over the prebuilt key tuple per match instead of a get() call per stat
+    rows = [tuple(map(match.get, _HOME_KEYS if home else _AWAY_KEYS, _DEFAULTS)) 
+            for match, home in zip(fixtures, home_flags)]
+    
+    if not rows:
+        return {name: [] for name in _COLUMN_NAMES}
+    
+    columns = dict(zip(_COLUMN_NAMES, map(list, zip(*rows))))
+    
+    for name in _POSITIVE_ONLY:
+        columns[name] = [value if value and value > 0 else 0 for value in columns[name]]
+    
+    return columns
+
+
+def _count_outcomes(goals_scored: List[int], goals_conceded: List[int]) -> Tuple[int, int, int, int, int, int]:
+    """
+    Count betting outcomes in a single pass over the goal columns
+    
+    Returns:
+        (over_05, over_15, over_25, btts, clean_sheets, failed_to_score)
+    """
+    over_05 = over_15 = over_25 = btts = clean_sheets = failed_to_score = 0
+    
+    # Comparisons add as 0/1, so there is no per-outcome branch
+    for scored, conceded in zip(goals_scored, goals_conceded):
+        total_goals = scored + conceded
+        over_05 += total_goals > 0.5
+        over_15 += total_goals > 1.5
+        over_25 += total_goals > 2.5
+        
+        btts += (scored > 0) & (conceded > 0)
+        clean_sheets += conceded == 0
+        failed_to_score += scored == 0
+    
+    return over_05, over_15, over_25, btts, clean_sheets, failed_to_score
+
+
+# Averages for a team with no matching fixtures (copied per call, callers may mutate)
+_EMPTY_AVERAGES = {
+    'matches': 0,
+    'corners_avg': 0.0,
+    'corners_1h_avg': 0.0,
+    'corners_2h_avg': 0.0,
+    'shots_avg': 0.0,
+    'shots_on_target_avg': 0.0,
+    'shots_off_target_avg': 0.0,
+    'cards_avg': 0.0,
+    'yellow_cards_avg': 0.0,
+    'red_cards_avg': 0.0,
+    'fouls_avg': 0.0,
+    'possession_avg': 0.0,
+    'goals_scored_avg': 0.0,
+    'goals_conceded_avg': 0.0,
+    'goals_1h_scored_avg': 0.0,
+    'goals_1h_conceded_avg': 0.0,
+    'xg_avg': 0.0,
+    'attacks_avg': 0.0,
+    'dangerous_attacks_avg': 0.0,
+    'offsides_avg': 0.0,
+    'over_05_pct': 0.0,
+    'over_15_pct': 0.0,
+    'over_25_pct': 0.0,
+    'btts_pct': 0.0,
+    'clean_sheet_pct': 0.0,
+    'failed_to_score_pct': 0.0,
+}
+
+
+# Below this many teams, process start-up and pickling cost more than they save
+_PARALLEL_MIN_TEAMS = 32
+
+
+def _team_averages_job(args: Tuple[Optional[int], int, List[Dict], Optional[bool]]) -> Dict:
+    """Worker entry point for StatCalculator.calculate_many (must be top level to pickle)"""
+    max_gameweek, team_id, fixtures, is_home = args
+    return StatCalculator(max_gameweek).calculate_team_averages(team_id, fixtures, is_home)
+
+
+class PlayerStats(NamedTuple):
+    """Betting-relevant player stats (see StatCalculator.calculate_player_stats_core)"""
+    player_id: Optional[int]
+    name: str
+    position: str
+    minutes_played: int
+    appearances: int
+    goals: int
+    assists: int
+    cards: int
+    yellow_cards: int
+    red_cards: int
+    goals_per_90: float
+    assists_per_90: float
+    cards_per_90: float
+    min_per_goal: float
+    min_per_card: float
+
+
 class StatCalculator:
     """
     Calculates statistics from match data
@@ -24,15 +161,42 @@ class StatCalculator:
                          If None, includes all data (live mode)
         """
         self.max_gameweek = max_gameweek
+        
+        # Lookup indexes, rebuilt only when a different (or resized) list is passed in
+        # (the H2H index also depends on max_gameweek, so that is part of its key).
+        # They can't see in-place edits, so lists passed in must not be mutated
+        # while they are in use (pass a new list instead)
+        self._h2h_index: Optional[Tuple[List[Dict], Tuple[int, Optional[int]], Dict[FrozenSet[int], List[Dict]]]] = None
+        self._player_names: Optional[Tuple[List[Dict], int, Dict[int, str]]] = None
+        self._filtered: Optional[Tuple[List[Dict], Tuple[int, Optional[int]], List[Dict]]] = None
     
     def filter_matches(self, matches: List[Dict]) -> List[Dict]:
-        """Filter matches based on gameweek limit and completion status"""
-        matches = [m for m in matches if is_completed_match(m)]
+        """
+        Filter matches based on gameweek limit and completion status
+        
+        The last result is memoized, since the same fixture list is usually
+        filtered several times per analysis (returns a fresh list each call).
+        The memo is keyed on the list's identity and length, so `matches` must
+        be treated as read-only: after editing matches in place (e.g. a status
+        update), pass a new list
+        """
+        if not matches:
+            return []
+        
+        max_gameweek = self.max_gameweek
+        key = (len(matches), max_gameweek)
         
-        if self.max_gameweek:
-            matches = filter_matches_before_gameweek(matches, self.max_gameweek)
+        cached = self._filtered
+        if cached and cached[0] is matches and cached[1] == key:
+            return list(cached[2])
         
-        return matches
+        if max_gameweek:
+            filtered = [m for m in matches if is_completed_match(m) and get_gameweek(m) < max_gameweek]
+        else:
+            filtered = [m for m in matches if is_completed_match(m)]
+        
+        self._filtered = (matches, key, filtered)
+        return list(filtered)
     
     def calculate_team_averages(self, team_id: int, fixtures: List[Dict], 
                                 is_home: Optional[bool] = None) -> Dict:
@@ -47,179 +211,96 @@ class StatCalculator:
         Returns:
             Dict with averages for corners, shots, cards, goals, etc.
         """
+        # Nothing to filter (e.g. promoted team pre-season)
+        if not fixtures:
+            return self._empty_averages()
+        
         # Filter matches
         fixtures = self.filter_matches(fixtures)
         
+        # Team's venue per fixture, resolved once for filtering and stat extraction
+        home_flags = [is_home_team(f, team_id) for f in fixtures]
+        
         # Filter by venue if specified
         if is_home is not None:
-            fixtures = [f for f in fixtures if is_home_team(f, team_id) == is_home]
+            fixtures = [f for f, home in zip(fixtures, home_flags) if home == is_home]
+            home_flags = [is_home] * len(fixtures)
         
         if not fixtures:
             return self._empty_averages()
         
         total_matches = len(fixtures)
         
-        # Accumulate stats
-        stats = {
-            'corners': 0,
-            'corners_1h': 0,
-            'corners_2h': 0,
-            'shots': 0,
-            'shots_on_target': 0,
-            'shots_off_target': 0,
-            'cards': 0,
-            'yellow_cards': 0,
-            'red_cards': 0,
-            'fouls': 0,
-            'possession': 0,
-            'goals_scored': 0,
-            'goals_conceded': 0,
-            'goals_1h_scored': 0,
-            'goals_1h_conceded': 0,
-            'xg': 0.0,
-            'attacks': 0,
-            'dangerous_attacks': 0,
-            'offsides': 0,
-        }
+        # Extract per-stat columns in one pass, then reduce each column
+        columns = _matches_to_columns(fixtures, home_flags)
+        stats = {name: sum(values) for name, values in columns.items()}
         
         # Count betting outcomes
-        over_05 = 0
-        over_15 = 0
-        over_25 = 0
-        btts = 0
-        clean_sheets = 0
-        failed_to_score = 0
-        
-        for match in fixtures:
-            # Corners
-            stats['corners'] += get_team_stats(match, team_id, 'corners')
-            stats['corners_1h'] += get_team_stats(match, team_id, 'fh_corners')
-            stats['corners_2h'] += get_team_stats(match, team_id, '2h_corners')
-            
-            # Shots
-            stats['shots'] += get_team_stats(match, team_id, 'shots')
-            stats['shots_on_target'] += get_team_stats(match, team_id, 'shotsOnTarget')
-            stats['shots_off_target'] += get_team_stats(match, team_id, 'shotsOffTarget')
-            
-            # Cards
-            stats['cards'] += get_team_stats(match, team_id, 'cards_num')
-            stats['yellow_cards'] += get_team_stats(match, team_id, 'yellow_cards')
-            stats['red_cards'] += get_team_stats(match, team_id, 'red_cards')
-            
-            # Other stats
-            stats['fouls'] += get_team_stats(match, team_id, 'fouls')
-            stats['possession'] += get_team_stats(match, team_id, 'possession')
-            stats['offsides'] += get_team_stats(match, team_id, 'offsides')
-            
-            # xG (if available)
-            xg = get_team_stats(match, team_id, 'xg')
-            if xg and xg > 0:
-                stats['xg'] += xg
-            
-            # Attacks (if available)
-            attacks = get_team_stats(match, team_id, 'attacks')
-            if attacks and attacks > 0:
-                stats['attacks'] += attacks
-            
-            dangerous = get_team_stats(match, team_id, 'dangerous_attacks')
-            if dangerous and dangerous > 0:
-                stats['dangerous_attacks'] += dangerous
-            
-            # Goals
-            goals_scored, goals_conceded = get_team_goals(match, team_id)
-            stats['goals_scored'] += goals_scored
-            stats['goals_conceded'] += goals_conceded
-            
-            # Half-time goals
-            if is_home_team(match, team_id):
-                stats['goals_1h_scored'] += match.get('ht_goals_team_a', 0)
-                stats['goals_1h_conceded'] += match.get('ht_goals_team_b', 0)
-            else:
-                stats['goals_1h_scored'] += match.get('ht_goals_team_b', 0)
-                stats['goals_1h_conceded'] += match.get('ht_goals_team_a', 0)
-            
-            # Betting outcomes
-            total_goals = goals_scored + goals_conceded
-            if total_goals > 0.5:
-                over_05 += 1
-            if total_goals > 1.5:
-                over_15 += 1
-            if total_goals > 2.5:
-                over_25 += 1
-            
-            if goals_scored > 0 and goals_conceded > 0:
-                btts += 1
-            
-            if goals_conceded == 0:
-                clean_sheets += 1
-            
-            if goals_scored == 0:
-                failed_to_score += 1
+        over_05, over_15, over_25, btts, clean_sheets, failed_to_score = _count_outcomes(
+            columns['goals_scored'], columns['goals_conceded']
+        )
         
         # Calculate averages
         averages = {
             'matches': total_matches,
-            'corners_avg': safe_divide(stats['corners'], total_matches),
-            'corners_1h_avg': safe_divide(stats['corners_1h'], total_matches),
-            'corners_2h_avg': safe_divide(stats['corners_2h'], total_matches),
-            'shots_avg': safe_divide(stats['shots'], total_matches),
-            'shots_on_target_avg': safe_divide(stats['shots_on_target'], total_matches),
-            'shots_off_target_avg': safe_divide(stats['shots_off_target'], total_matches),
-            'cards_avg': safe_divide(stats['cards'], total_matches),
-            'yellow_cards_avg': safe_divide(stats['yellow_cards'], total_matches),
-            'red_cards_avg': safe_divide(stats['red_cards'], total_matches),
-            'fouls_avg': safe_divide(stats['fouls'], total_matches),
-            'possession_avg': safe_divide(stats['possession'], total_matches),
-            'goals_scored_avg': safe_divide(stats['goals_scored'], total_matches),
-            'goals_conceded_avg': safe_divide(stats['goals_conceded'], total_matches),
-            'goals_1h_scored_avg': safe_divide(stats['goals_1h_scored'], total_matches),
-            'goals_1h_conceded_avg': safe_divide(stats['goals_1h_conceded'], total_matches),
-            'xg_avg': safe_divide(stats['xg'], total_matches),
-            'attacks_avg': safe_divide(stats['attacks'], total_matches),
-            'dangerous_attacks_avg': safe_divide(stats['dangerous_attacks'], total_matches),
-            'offsides_avg': safe_divide(stats['offsides'], total_matches),
+            'corners_avg': raw_divide(stats['corners'], total_matches),
+            'corners_1h_avg': raw_divide(stats['corners_1h'], total_matches),
+            'corners_2h_avg': raw_divide(stats['corners_2h'], total_matches),
+            'shots_avg': raw_divide(stats['shots'], total_matches),
+            'shots_on_target_avg': raw_divide(stats['shots_on_target'], total_matches),
+            'shots_off_target_avg': raw_divide(stats['shots_off_target'], total_matches),
+            'cards_avg': raw_divide(stats['cards'], total_matches),
+            'yellow_cards_avg': raw_divide(stats['yellow_cards'], total_matches),
+            'red_cards_avg': raw_divide(stats['red_cards'], total_matches),
+            'fouls_avg': raw_divide(stats['fouls'], total_matches),
+            'possession_avg': raw_divide(stats['possession'], total_matches),
+            'goals_scored_avg': raw_divide(stats['goals_scored'], total_matches),
+            'goals_conceded_avg': raw_divide(stats['goals_conceded'], total_matches),
+            'goals_1h_scored_avg': raw_divide(stats['goals_1h_scored'], total_matches),
+            'goals_1h_conceded_avg': raw_divide(stats['goals_1h_conceded'], total_matches),
+            'xg_avg': raw_divide(stats['xg'], total_matches),
+            'attacks_avg': raw_divide(stats['attacks'], total_matches),
+            'dangerous_attacks_avg': raw_divide(stats['dangerous_attacks'], total_matches),
+            'offsides_avg': raw_divide(stats['offsides'], total_matches),
             
             # Betting percentages
-            'over_05_pct': safe_divide(over_05 * 100, total_matches),
-            'over_15_pct': safe_divide(over_15 * 100, total_matches),
-            'over_25_pct': safe_divide(over_25 * 100, total_matches),
-            'btts_pct': safe_divide(btts * 100, total_matches),
-            'clean_sheet_pct': safe_divide(clean_sheets * 100, total_matches),
-            'failed_to_score_pct': safe_divide(failed_to_score * 100, total_matches),
+            'over_05_pct': raw_divide(over_05 * 100, total_matches),
+            'over_15_pct': raw_divide(over_15 * 100, total_matches),
+            'over_25_pct': raw_divide(over_25 * 100, total_matches),
+            'btts_pct': raw_divide(btts * 100, total_matches),
+            'clean_sheet_pct': raw_divide(clean_sheets * 100, total_matches),
+            'failed_to_score_pct': raw_divide(failed_to_score * 100, total_matches),
         }
         
         return averages
     
+    def calculate_many(self, team_ids: List[int], fixtures_by_team: Dict[int, List[Dict]], 
+                       is_home: Optional[bool] = None, max_workers: Optional[int] = None) -> Dict[int, Dict]:
+        """
+        Calculate team averages for many teams (e.g. a whole backtest gameweek)
+        
+        Teams are independent, so large batches are spread over a process pool;
+        small batches run in-process
+        
+        Returns:
+            Dict of team_id -> calculate_team_averages result
+        """
+        if len(team_ids) < _PARALLEL_MIN_TEAMS:
+            return {
+                team_id: self.calculate_team_averages(team_id, fixtures_by_team.get(team_id, []), is_home)
+                for team_id in team_ids
+            }
+        
+        jobs = [(self.max_gameweek, team_id, fixtures_by_team.get(team_id, []), is_home) for team_id in team_ids]
+        
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            results = list(pool.map(_team_averages_job, jobs, chunksize=8))
+        
+        return dict(zip(team_ids, results))
+    
     def _empty_averages(self) -> Dict:
         """Return empty averages dict"""
-        return {
-            'matches': 0,
-            'corners_avg': 0.0,
-            'corners_1h_avg': 0.0,
-            'corners_2h_avg': 0.0,
-            'shots_avg': 0.0,
-            'shots_on_target_avg': 0.0,
-            'shots_off_target_avg': 0.0,
-            'cards_avg': 0.0,
-            'yellow_cards_avg': 0.0,
-            'red_cards_avg': 0.0,
-            'fouls_avg': 0.0,
-            'possession_avg': 0.0,
-            'goals_scored_avg': 0.0,
-            'goals_conceded_avg': 0.0,
-            'goals_1h_scored_avg': 0.0,
-            'goals_1h_conceded_avg': 0.0,
-            'xg_avg': 0.0,
-            'attacks_avg': 0.0,
-            'dangerous_attacks_avg': 0.0,
-            'offsides_avg': 0.0,
-            'over_05_pct': 0.0,
-            'over_15_pct': 0.0,
-            'over_25_pct': 0.0,
-            'btts_pct': 0.0,
-            'clean_sheet_pct': 0.0,
-            'failed_to_score_pct': 0.0,
-        }
+        return dict(_EMPTY_AVERAGES)
     
     def calculate_player_stats(self, player: Dict, min_minutes: int = 450) -> Optional[Dict]:
         """
@@ -232,58 +313,83 @@ class StatCalculator:
         Returns:
             Player stats dict or None if below threshold
         """
+        stats = self.calculate_player_stats_core(player, min_minutes)
+        return stats._asdict() if stats else None
+    
+    def calculate_player_stats_core(self, player: Dict, min_minutes: int = 450) -> Optional[PlayerStats]:
+        """
+        calculate_player_stats as a PlayerStats tuple (no per-call dict build)
+        
+        Use this in loops over many players; convert with ._asdict() only for output
+        """
         minutes_played = player.get('minutes_played_overall', 0)
         
         # Filter by minimum minutes
         if minutes_played < min_minutes:
             return None
         
-        # Convert to per-90 stats
-        mins_per_90 = minutes_played / 90.0
-        
         goals = player.get('goals_overall', 0)
         assists = player.get('assists_overall', 0)
         cards = player.get('cards_overall', 0)
         yellow_cards = player.get('yellow_cards_overall', 0)
         red_cards = player.get('red_cards_overall', 0)
         
-        return {
-            'player_id': player.get('id'),
-            'name': player.get('known_as', player.get('full_name', 'Unknown')),
-            'position': player.get('position', 'Unknown'),
-            'minutes_played': minutes_played,
-            'appearances': player.get('appearances_overall', 0),
-            'goals': goals,
-            'assists': assists,
-            'cards': cards,
-            'yellow_cards': yellow_cards,
-            'red_cards': red_cards,
-            'goals_per_90': safe_divide(goals * 90, minutes_played),
-            'assists_per_90': safe_divide(assists * 90, minutes_played),
-            'cards_per_90': safe_divide(cards * 90, minutes_played),
-            'min_per_goal': safe_divide(minutes_played, goals) if goals > 0 else 0,
-            'min_per_card': safe_divide(minutes_played, cards) if cards > 0 else 0,
-        }
+        return PlayerStats(
+            player.get('id'),
+            player.get('known_as', player.get('full_name', 'Unknown')),
+            player.get('position', 'Unknown'),
+            minutes_played,
+            player.get('appearances_overall', 0),
+            goals,
+            assists,
+            cards,
+            yellow_cards,
+            red_cards,
+            raw_divide(goals * 90, minutes_played),
+            raw_divide(assists * 90, minutes_played),
+            raw_divide(cards * 90, minutes_played),
+            raw_divide(minutes_played, goals) if goals > 0 else 0,
+            raw_divide(minutes_played, cards) if cards > 0 else 0,
+        )
+    
+    def index_matches(self, all_matches: List[Dict]) -> Dict[FrozenSet[int], List[Dict]]:
+        """
+        Group filtered matches by team pair
+        
+        Returns:
+            Dict of frozenset({homeID, awayID}) -> matches in original order
+        """
+        index: Dict[FrozenSet[int], List[Dict]] = {}
+        for match in self.filter_matches(all_matches):
+            index.setdefault(frozenset((match.get('homeID'), match.get('awayID'))), []).append(match)
+        return index
+    
+    def _get_h2h_index(self, all_matches: List[Dict]) -> Dict[FrozenSet[int], List[Dict]]:
+        """Get index_matches(all_matches), reusing it across calls with the same list"""
+        key = (len(all_matches), self.max_gameweek)
+        cached = self._h2h_index
+        if cached and cached[0] is all_matches and cached[1] == key:
+            return cached[2]
+        
+        index = self.index_matches(all_matches)
+        self._h2h_index = (all_matches, key, index)
+        return index
     
     def get_h2h_stats(self, team_a_id: int, team_b_id: int, all_matches: List[Dict]) -> Optional[Dict]:
         """
         Get head-to-head stats between two teams (this season only - reverse fixture)
         
+        The pair index is reused while the same, unresized `all_matches` list
+        is passed, so it must not be edited in place between calls
+        
         Returns:
             H2H stats dict or None if no previous meeting
         """
-        # Filter matches
-        matches = self.filter_matches(all_matches)
+        if not all_matches:
+            return None
         
         # Find reverse fixture (both teams involved)
-        h2h_matches = []
-        for match in matches:
-            home_id = match.get('homeID')
-            away_id = match.get('awayID')
-            
-            if (home_id == team_a_id and away_id == team_b_id) or \
-               (home_id == team_b_id and away_id == team_a_id):
-                h2h_matches.append(match)
+        h2h_matches = self._get_h2h_index(all_matches).get(frozenset((team_a_id, team_b_id)))
         
         if not h2h_matches:
             return None
@@ -322,19 +428,40 @@ class StatCalculator:
             'total_goals': team_a_goals + team_b_goals,
         }
     
-    def get_player_name_from_id(self, player_id: int, all_players: List[Dict]) -> Optional[str]:
+    def build_player_index(self, all_players: List[Dict]) -> Dict[int, str]:
+        """
+        Build and store the {player_id: name} index used by get_player_name_from_id
+        
+        First entry wins if a player ID appears more than once
+        """
+        names = {}
+        for player in all_players:
+            names.setdefault(player.get('id'), player.get('known_as') or player.get('full_name') or 'Unknown')
+        
+        self._player_names = (all_players, len(all_players), names)
+        return names
+    
+    def get_player_name_from_id(self, player_id: int, all_players: Optional[List[Dict]] = None) -> Optional[str]:
         """
         Get player name from player ID
         
         Args:
             player_id: Player ID to lookup
-            all_players: List of all player dictionaries
+            all_players: List of all player dictionaries. Can be omitted after
+                         build_player_index; a new list rebuilds the index
+                         (in-place edits to the same list are not detected)
         
         Returns:
             Player name or None if not found
         """
-        for player in all_players:
-            if player.get('id') == player_id:
-                return player.get('known_as') or player.get('full_name') or 'Unknown'
+        cached = self._player_names
+        
+        if all_players is None:
+            return cached[2].get(player_id) if cached else None
+        
+        if cached and cached[0] is all_players and cached[1] == len(all_players):
+            names = cached[2]
+        else:
+            names = self.build_player_index(all_players)
         
-        return None
\ No newline at end of file
+        return names.get(player_id)
\ No newline at end of file
@@ -4,7 +4,62 @@ Calculates comprehensive quality ratings based on multiple factors
 """
 
 from typing import Dict, List, Optional
-from .utils import calculate_percentage, safe_divide, get_match_result, is_home_team, filter_matches_before_gameweek, is_completed_match
+from .utils import calculate_percentage, safe_divide, get_match_points, is_home_team, get_gameweek, is_completed_match
+
+
+# Result label per league points
+_POINTS_RESULT = {3: 'W', 1: 'D', 0: 'L'}
+
+# Component weights: position, form, venue, momentum, opposition
+_WEIGHTS = (0.30, 0.25, 0.20, 0.15, 0.10)
+
+
+def index_league_table(league_table: dict) -> Dict[int, dict]:
+    """
+    Build {team_id: table row} in one pass over a league table
+    
+    league_table rows are checked first, then specific_tables (flat, then
+    grouped); the first row found for a team wins
+    """
+    index = {}
+    data = league_table.get('data', {})
+    
+    for team in data.get('league_table', []) or []:
+        index.setdefault(team.get('id'), team)
+    
+    # Tournament formats keep rows under specific_tables (flat or grouped)
+    for round_data in data.get('specific_tables', []):
+        if round_data.get('table'):
+            for team in round_data['table']:
+                index.setdefault(team.get('id'), team)
+        
+        if round_data.get('groups'):
+            for group in round_data['groups']:
+                if group.get('table'):
+                    for team in group['table']:
+                        index.setdefault(team.get('id'), team)
+    
+    return index
+
+
+def compute_quality_ratings(team_ids: List[int], league_table: dict, 
+                            fixtures_by_team: Dict[int, list], max_gameweek: Optional[int] = None, 
+                            is_home: bool = True) -> Dict[int, dict]:
+    """
+    Quality breakdowns for many teams at once (e.g. every team in a backtest gameweek)
+    
+    The league table is indexed once and shared by every analyzer
+    
+    Returns:
+        Dict of team_id -> get_quality_breakdown(is_home)
+    """
+    table_index = index_league_table(league_table)
+    
+    return {
+        team_id: TeamQualityAnalyzer(league_table, fixtures_by_team.get(team_id, []), team_id, 
+                                     max_gameweek, table_index=table_index).get_quality_breakdown(is_home)
+        for team_id in team_ids
+    }
 
 
 class TeamQualityAnalyzer:
@@ -18,13 +73,15 @@ class TeamQualityAnalyzer:
     """
     
     def __init__(self, league_table: dict, all_fixtures: list, team_id: int, 
-                 max_gameweek: Optional[int] = None):
+                 max_gameweek: Optional[int] = None, table_index: Optional[Dict[int, dict]] = None):
         """
         Args:
             league_table: League table data
             all_fixtures: All team fixtures (will be filtered by max_gameweek)
             team_id: Team ID to analyze
             max_gameweek: Maximum gameweek to include (for backtesting)
+            table_index: Optional {team_id: table row} from index_league_table,
+                         saves searching the table again for every team
         """
         self.team_id = team_id
         self.max_gameweek = max_gameweek
@@ -32,42 +89,27 @@ class TeamQualityAnalyzer:
         # Filter fixtures if backtesting
         if max_gameweek:
             self.fixtures = [f for f in all_fixtures 
-                           if is_completed_match(f) and 
-                           filter_matches_before_gameweek([f], max_gameweek)]
+                           if is_completed_match(f) and get_gameweek(f) < max_gameweek]
         else:
             self.fixtures = [f for f in all_fixtures if is_completed_match(f)]
         
+        # Venue and result per fixture, derived once and shared by every rating component
+        self._is_home = [is_home_team(f, team_id) for f in self.fixtures]
+        self._points = [get_match_points(f, team_id) for f in self.fixtures]
+        self._results = [_POINTS_RESULT[p] for p in self._points]
+        
+        # Per-venue fixtures and points, split in a single pass (looked up with
+        # .get, so a venue other than True/False matches no fixtures)
+        self._venue_fixtures = {True: [], False: []}
+        self._venue_points = {True: [], False: []}
+        for f, home, points in zip(self.fixtures, self._is_home, self._points):
+            self._venue_fixtures[home].append(f)
+            self._venue_points[home].append(points)
+        
         # Extract team info from league table
-        self.team_info = self._find_team_in_table(league_table)
-        
-    def _find_team_in_table(self, league_table: dict) -> Optional[dict]:
-        """Find team in league table"""
-        data = league_table.get('data', {})
-        
-        # Handle different table structures
-        league_table_list = data.get('league_table', [])
-        
-        if league_table_list:
-            for team in league_table_list:
-                if team.get('id') == self.team_id:
-                    return team
-        
-        # Check specific_tables for tournament formats
-        specific_tables = data.get('specific_tables', [])
-        for round_data in specific_tables:
-            if round_data.get('table'):
-                for team in round_data['table']:
-                    if team.get('id') == self.team_id:
-                        return team
-            
-            if round_data.get('groups'):
-                for group in round_data['groups']:
-                    if group.get('table'):
-                        for team in group['table']:
-                            if team.get('id') == self.team_id:
-                                return team
-        
-        return None
+        if table_index is None:
+            table_index = index_league_table(league_table)
+        self.team_info = table_index.get(team_id)
     
     def calculate_quality_rating(self, is_home: bool = True) -> int:
         """
@@ -90,21 +132,8 @@ class TeamQualityAnalyzer:
         opposition_rating = self._calculate_opposition_quality_rating()
         
         # Weighted combination
-        weights = {
-            'position': 0.30,
-            'form': 0.25,
-            'venue': 0.20,
-            'momentum': 0.15,
-            'opposition': 0.10
-        }
-        
-        overall = (
-            position_rating * weights['position'] +
-            form_rating * weights['form'] +
-            venue_rating * weights['venue'] +
-            momentum_rating * weights['momentum'] +
-            opposition_rating * weights['opposition']
-        )
+        ratings = (position_rating, form_rating, venue_rating, momentum_rating, opposition_rating)
+        overall = sum(rating * weight for rating, weight in zip(ratings, _WEIGHTS))
         
         return int(round(overall))
     
@@ -131,17 +160,16 @@ class TeamQualityAnalyzer:
     def _calculate_form_rating(self, is_home: bool) -> int:
         """Rating based on recent form (0-100)"""
         # Get last 6 matches
-        recent_fixtures = self._get_recent_fixtures(6, is_home)
+        # No venue (None) means the last 6 overall, as _get_recent_fixtures(6, None) did
+        points = self._points if is_home is None else self._venue_points.get(is_home, ())
+        recent_points = points[-6:]
         
-        if not recent_fixtures:
+        if not recent_points:
             return 50
         
-        wins = sum(1 for m in recent_fixtures if get_match_result(m, self.team_id) == 'W')
-        draws = sum(1 for m in recent_fixtures if get_match_result(m, self.team_id) == 'D')
-        
         # Points from last 6 (max 18)
-        points = (wins * 3) + draws
-        max_points = len(recent_fixtures) * 3
+        points = sum(recent_points)
+        max_points = len(recent_points) * 3
         
         rating = (points / max_points) * 100
         
@@ -149,17 +177,13 @@ class TeamQualityAnalyzer:
     
     def _calculate_venue_rating(self, is_home: bool) -> int:
         """Rating based on home/away performance (0-100)"""
-        venue_fixtures = [f for f in self.fixtures 
-                         if is_home_team(f, self.team_id) == is_home]
+        venue_points = self._venue_points.get(is_home, ())
         
-        if not venue_fixtures:
+        if not venue_points:
             return 50
         
-        wins = sum(1 for m in venue_fixtures if get_match_result(m, self.team_id) == 'W')
-        draws = sum(1 for m in venue_fixtures if get_match_result(m, self.team_id) == 'D')
-        
-        points = (wins * 3) + draws
-        max_points = len(venue_fixtures) * 3
+        points = sum(venue_points)
+        max_points = len(venue_points) * 3
         
         rating = (points / max_points) * 100
         
@@ -173,16 +197,8 @@ class TeamQualityAnalyzer:
         if len(self.fixtures) < 6:
             return 50
         
-        last_3 = self.fixtures[-3:]
-        previous_3 = self.fixtures[-6:-3]
-        
-        def get_points(matches):
-            wins = sum(1 for m in matches if get_match_result(m, self.team_id) == 'W')
-            draws = sum(1 for m in matches if get_match_result(m, self.team_id) == 'D')
-            return (wins * 3) + draws
-        
-        recent_points = get_points(last_3)
-        previous_points = get_points(previous_3)
+        recent_points = sum(self._points[-3:])
+        previous_points = sum(self._points[-6:-3])
         
         # Compare momentum
         if recent_points > previous_points:
@@ -224,14 +240,13 @@ class TeamQualityAnalyzer:
         fixtures = self.fixtures
         
         if venue_filter is not None:
-            fixtures = [f for f in fixtures if is_home_team(f, self.team_id) == venue_filter]
+            fixtures = self._venue_fixtures.get(venue_filter, [])
         
         return fixtures[-count:] if len(fixtures) >= count else fixtures
     
     def get_form_string(self, count: int = 6) -> str:
         """Get form string (e.g., 'W-W-L-D-W-L')"""
-        recent = self._get_recent_fixtures(count)
-        results = [get_match_result(m, self.team_id) for m in recent]
+        results = self._results[-count:] if len(self._results) >= count else self._results
         return "-".join(results) if results else "No data"
     
     def get_quality_breakdown(self, is_home: bool = True) -> dict:
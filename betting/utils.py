@@ -2,7 +2,10 @@
 Utility functions for the betting analysis system
 """
 
+import sys
+from bisect import bisect_right
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
 
@@ -20,18 +23,27 @@ def safe_divide(numerator: float, denominator: float, default: float = 0.0) -> f
     return round(numerator / denominator, 2)
 
 
+def raw_divide(numerator: float, denominator: float, default: float = 0.0) -> float:
+    """Divide without rounding (for values consumed by further calculations)"""
+    if denominator == 0:
+        return default
+    return numerator / denominator
+
+
+# Quality tier lower bounds and labels (tier i applies from _TIER_THRESHOLDS[i - 1])
+_TIER_THRESHOLDS = (40, 55, 70, 85)
+_TIERS = (
+    "⭐ Relegation",
+    "⭐⭐ Lower-Mid",
+    "⭐⭐⭐ Mid-Table",
+    "⭐⭐⭐⭐ Strong",
+    "⭐⭐⭐⭐⭐ Elite",
+)
+
+
 def get_quality_tier_emoji(rating: int) -> str:
     """Get emoji representation for quality tier"""
-    if rating >= 85:
-        return "⭐⭐⭐⭐⭐ Elite"
-    elif rating >= 70:
-        return "⭐⭐⭐⭐ Strong"
-    elif rating >= 55:
-        return "⭐⭐⭐ Mid-Table"
-    elif rating >= 40:
-        return "⭐⭐ Lower-Mid"
-    else:
-        return "⭐ Relegation"
+    return _TIERS[bisect_right(_TIER_THRESHOLDS, rating)]
 
 
 def format_form_string(results: list) -> str:
@@ -82,18 +94,35 @@ def get_team_stats(match: dict, team_id: int, stat_prefix: str) -> int:
     Returns:
         Stat value for the team
     """
-    if is_home_team(match, team_id):
-        return match.get(f'team_a_{stat_prefix}', 0)
-    else:
-        return match.get(f'team_b_{stat_prefix}', 0)
+    return get_side_stats(match, is_home_team(match, team_id), stat_prefix)
 
 
 def get_opponent_stats(match: dict, team_id: int, stat_prefix: str) -> int:
     """Get opponent's stat from match"""
-    if is_home_team(match, team_id):
-        return match.get(f'team_b_{stat_prefix}', 0)
+    return get_side_stats(match, not is_home_team(match, team_id), stat_prefix)
+
+
+# Common per-team stat prefixes, with their match keys built (and interned) once
+_STAT_PREFIXES = (
+    'corners', 'fh_corners', '2h_corners', 'shots', 'shotsOnTarget', 'shotsOffTarget',
+    'cards_num', 'yellow_cards', 'red_cards', 'fouls', 'possession', 'offsides',
+    'xg', 'attacks', 'dangerous_attacks',
+)
+_TEAM_A_KEYS = {prefix: sys.intern(f'team_a_{prefix}') for prefix in _STAT_PREFIXES}
+_TEAM_B_KEYS = {prefix: sys.intern(f'team_b_{prefix}') for prefix in _STAT_PREFIXES}
+
+
+def get_side_stats(match: dict, is_home: bool, stat_prefix: str) -> int:
+    """
+    Get home (team_a) or away (team_b) stat from match
+    
+    For callers that already know the team's venue, skipping the homeID lookup
+    """
+    if is_home:
+        key = _TEAM_A_KEYS.get(stat_prefix) or f'team_a_{stat_prefix}'
     else:
-        return match.get(f'team_a_{stat_prefix}', 0)
+        key = _TEAM_B_KEYS.get(stat_prefix) or f'team_b_{stat_prefix}'
+    return match.get(key, 0)
 
 
 def get_match_result(match: dict, team_id: int) -> str:
@@ -113,6 +142,26 @@ def get_match_result(match: dict, team_id: int) -> str:
         return 'L'
 
 
+def get_match_points(match: dict, team_id: int) -> int:
+    """
+    Get league points from team's perspective (reads goals directly, no 'W'/'D'/'L' step)
+    
+    Returns:
+        3 for a win, 1 for a draw, 0 for a loss
+    """
+    if is_home_team(match, team_id):
+        goals_for, goals_against = match.get('homeGoalCount', 0), match.get('awayGoalCount', 0)
+    else:
+        goals_for, goals_against = match.get('awayGoalCount', 0), match.get('homeGoalCount', 0)
+    
+    if goals_for > goals_against:
+        return 3
+    elif goals_for == goals_against:
+        return 1
+    else:
+        return 0
+
+
 def is_completed_match(match: dict) -> bool:
     """Check if match is completed"""
     return match.get('status') == 'complete'
@@ -151,11 +200,13 @@ def seconds_to_minutes(seconds: int) -> int:
     return seconds // 60
 
 
+@lru_cache(maxsize=4096)
 def unix_to_datetime(unix_timestamp: int) -> datetime:
-    """Convert unix timestamp to datetime"""
+    """Convert unix timestamp to datetime (cached - many matches share a kick-off time)"""
     return datetime.fromtimestamp(unix_timestamp)
 
 
+@lru_cache(maxsize=4096)
 def format_date(unix_timestamp: int, format_str: str = "%d/%m/%Y") -> str:
     """Format unix timestamp as date string"""
     return unix_to_datetime(unix_timestamp).strftime(format_str)
@@ -4,9 +4,15 @@ Browse fixtures by date. Priority leagues shown first.
 Each fixture shows two lines: team names + score/vs, then comp form and overall form.
 """
 
+import os
 import sys
+import time
+import pickle
+import hashlib
 import calendar
-from datetime import datetime, date
+from collections import defaultdict, deque
+from datetime import date
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -39,7 +45,7 @@ PRIORITY_SET = set(PRIORITY_LEAGUE_KEYS)
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _ordinal(n: int) -> str:
+def _format_ordinal(n: int) -> str:
     if 11 <= (n % 100) <= 13:
         suffix = "th"
     else:
@@ -47,8 +53,63 @@ def _ordinal(n: int) -> str:
     return f"{n}{suffix}"
 
 
-def _unix_to_local(ts: int) -> datetime:
-    return datetime.fromtimestamp(ts)
+# League positions are small, so the common case is a tuple index
+ORDINALS = tuple(_format_ordinal(i) for i in range(101))
+
+
+def _ordinal(n: int) -> str:
+    if 0 <= n < len(ORDINALS):
+        return ORDINALS[n]
+    return _format_ordinal(n)
+
+
+def _local_date(ts: int) -> date:
+    # struct_time fields avoid building a full datetime per match
+    tl = time.localtime(ts)
+    return date(tl.tm_year, tl.tm_mon, tl.tm_mday)
+
+
+# Where standings live in the various league_table.json shapes, in probe order
+_STANDINGS_KEYS = ("standings", "table", "data", "results")
+_OVERALL_STANDINGS_KEYS = ("standings", "table", "data")
+_TEAM_ID_KEYS = ("id", "team_id", "teamId")
+_POS_KEYS = ("position", "pos", "rank")
+
+
+def _find_list(container: Dict, keys: Tuple[str, ...]) -> Optional[List]:
+    """First value under keys that is a list."""
+    for key in keys:
+        value = container.get(key)
+        if isinstance(value, list):
+            return value
+    return None
+
+
+def _first_truthy(entry: Dict, keys: Tuple[str, ...], default=None):
+    """Same as entry.get(k1) or entry.get(k2) or ... or default."""
+    for key in keys:
+        value = entry.get(key)
+        if value:
+            return value
+    return default if default is not None else value
+
+
+def _find_standings(league_table) -> Optional[List]:
+    if isinstance(league_table, list):
+        return league_table
+    if not isinstance(league_table, dict):
+        return None
+
+    standings = _find_list(league_table, _STANDINGS_KEYS)
+    if standings is None:
+        overall = league_table.get("overall")
+        if isinstance(overall, list):
+            standings = overall
+        elif isinstance(overall, dict):
+            standings = _find_list(overall, _OVERALL_STANDINGS_KEYS)
+    if standings is None:
+        standings = next((v for v in league_table.values() if isinstance(v, list) and v), None)
+    return standings
 
 
 def _build_position_map(league_table: Optional[Dict]) -> Dict[int, int]:
@@ -56,30 +117,7 @@ def _build_position_map(league_table: Optional[Dict]) -> Dict[int, int]:
     if not league_table:
         return {}
 
-    standings = None
-
-    if isinstance(league_table, list):
-        standings = league_table
-    elif isinstance(league_table, dict):
-        for key in ("standings", "table", "data", "results"):
-            if isinstance(league_table.get(key), list):
-                standings = league_table[key]
-                break
-        if standings is None:
-            overall = league_table.get("overall")
-            if isinstance(overall, list):
-                standings = overall
-            elif isinstance(overall, dict):
-                for key in ("standings", "table", "data"):
-                    if isinstance(overall.get(key), list):
-                        standings = overall[key]
-                        break
-        if standings is None:
-            for v in league_table.values():
-                if isinstance(v, list) and v:
-                    standings = v
-                    break
-
+    standings = _find_standings(league_table)
     if not standings:
         return {}
 
@@ -87,88 +125,74 @@ def _build_position_map(league_table: Optional[Dict]) -> Dict[int, int]:
     for i, entry in enumerate(standings, start=1):
         if not isinstance(entry, dict):
             continue
-        team_id = entry.get("id") or entry.get("team_id") or entry.get("teamId")
-        pos = entry.get("position") or entry.get("pos") or entry.get("rank") or i
+        team_id = _first_truthy(entry, _TEAM_ID_KEYS)
         if team_id is not None:
             try:
-                positions[int(team_id)] = int(pos)
+                positions[int(team_id)] = int(_first_truthy(entry, _POS_KEYS, i))
             except (ValueError, TypeError):
                 pass
 
     return positions
 
 
+# date_unix is always an int once DataLoader.load_all_matches has normalized it
+_by_date = itemgetter("date_unix")
+_by_first = itemgetter(0)
+
+
+# Indexed by goal-difference sign + 1 from the team's point of view
+_RESULTS = ("L", "D", "W")
+
+
 def _get_result(match: Dict, team_id: int) -> str:
     """Return W / D / L for team_id in this completed match."""
-    is_home = match.get("homeID") == team_id
     hg = match.get("homeGoalCount", 0)
     ag = match.get("awayGoalCount", 0)
-    if is_home:
-        if hg > ag: return "W"
-        if hg < ag: return "L"
-        return "D"
-    else:
-        if ag > hg: return "W"
-        if ag < hg: return "L"
-        return "D"
+    sign = (hg > ag) - (hg < ag)
+    if match.get("homeID") != team_id:
+        sign = -sign
+    return _RESULTS[sign + 1]
 
 
 # ---------------------------------------------------------------------------
 # Form map builders
 # ---------------------------------------------------------------------------
 
-def _build_overall_form_map(all_league_matches: List[Tuple]) -> Dict[int, str]:
+def build_form_maps(
+    all_league_matches: List[Tuple],
+) -> Tuple[Dict[int, str], Dict[Tuple[str, int], str]]:
     """
-    {team_id: 'WWDLW'} — last 5 results across ALL competitions combined.
+    Overall and per-competition form in a single pass over completed matches.
+    Returns:
+        overall_form_map : {team_id: 'WWDLW'} — last 5 results across ALL competitions
+        comp_form_map    : {(league_key, team_id): 'WWDLW'} — last 5 within each competition
     """
+    # One stable sort by date; each league's matches stay in date order as a subsequence
     all_complete = []
-    for _key, _sid, matches in all_league_matches:
+    for league_key, _sid, matches in all_league_matches:
         for m in matches:
             if m.get("status") == "complete":
-                all_complete.append(m)
+                all_complete.append((m["date_unix"], league_key, m))
 
-    all_complete.sort(key=lambda m: m.get("date_unix") or 0)
+    all_complete.sort(key=_by_first)
 
-    team_results: Dict[int, List[str]] = {}
-    for m in all_complete:
+    # deque(maxlen=5) keeps just the last 5 results per team
+    overall: Dict[int, deque] = defaultdict(lambda: deque(maxlen=5))
+    comp: Dict[Tuple[str, int], deque] = defaultdict(lambda: deque(maxlen=5))
+
+    for _ts, league_key, m in all_complete:
         for id_key in ("homeID", "awayID"):
             tid = m.get(id_key)
             if tid is None:
                 continue
-            tid = int(tid)
-            team_results.setdefault(tid, []).append(_get_result(m, tid))
-
-    return {tid: "".join(results[-5:]) for tid, results in team_results.items()}
-
-
-def _build_comp_form_maps(all_league_matches: List[Tuple]) -> Dict[str, Dict[int, str]]:
-    """
-    {league_key: {team_id: 'WWDLW'}} — last 5 results within each specific competition.
-    """
-    # Collect completed matches per league key, sorted by date
-    per_league: Dict[str, List[Dict]] = {}
-    for league_key, _sid, matches in all_league_matches:
-        complete = sorted(
-            [m for m in matches if m.get("status") == "complete"],
-            key=lambda m: m.get("date_unix") or 0
-        )
-        per_league[league_key] = complete
+            result = _get_result(m, tid)
+            overall[tid].append(result)
+            comp[league_key, tid].append(result)
 
-    comp_form_maps: Dict[str, Dict[int, str]] = {}
-    for league_key, matches in per_league.items():
-        team_results: Dict[int, List[str]] = {}
-        for m in matches:
-            for id_key in ("homeID", "awayID"):
-                tid = m.get(id_key)
-                if tid is None:
-                    continue
-                tid = int(tid)
-                team_results.setdefault(tid, []).append(_get_result(m, tid))
-        comp_form_maps[league_key] = {
-            tid: "".join(results[-5:]) for tid, results in team_results.items()
-        }
+    overall_form_map = {tid: "".join(results) for tid, results in overall.items()}
+    comp_form_map = {key: "".join(results) for key, results in comp.items()}
 
-    return comp_form_maps
+    return overall_form_map, comp_form_map
 
 
 # ---------------------------------------------------------------------------
@@ -202,22 +226,123 @@ def load_all_league_data(loader: DataLoader):
     return league_info_map, league_matches, position_maps
 
 
+def build_date_index(league_matches: List[Tuple]) -> Dict[date, Dict[str, List[Dict]]]:
+    """
+    {local_date: {league_key: [matches sorted by ko]}} — built once per session,
+    so browsing a date is a lookup rather than a scan of every match.
+    """
+    index: Dict[date, Dict[str, List[Dict]]] = {}
+    for league_key, _sid, matches in league_matches:
+        for m in matches:
+            ts = m.get("date_unix") or m.get("timestamp")
+            if not ts:
+                continue
+            day = _local_date(ts)
+            index.setdefault(day, {}).setdefault(league_key, []).append(m)
+
+    for by_league in index.values():
+        for day_matches in by_league.values():
+            day_matches.sort(key=_by_date)
+
+    return index
+
+
 def get_fixtures_for_date(
     target_date: date,
-    league_matches: List[Tuple],
+    date_index: Dict[date, Dict[str, List[Dict]]],
 ) -> Dict[str, List[Dict]]:
     """Return {league_key: [matches on target_date sorted by ko]}."""
-    result: Dict[str, List[Dict]] = {}
-    for league_key, _sid, matches in league_matches:
-        day_matches = [
-            m for m in matches
-            if (ts := m.get("date_unix") or m.get("timestamp"))
-            and _unix_to_local(ts).date() == target_date
+    return date_index.get(target_date, {})
+
+
+# ---------------------------------------------------------------------------
+# Startup cache
+# ---------------------------------------------------------------------------
+
+CACHE_NAME = "fixtures_v2"
+
+
+def _source_signature(loader: DataLoader) -> str:
+    """
+    Hash of (path, mtime, size) for every file load_all_league_data reads,
+    plus this module (the builders), betting/data_loader.py (its match
+    normalization fills in the fields the builders rely on) and the local
+    timezone (the date index is bucketed by local date).
+    """
+    digest = hashlib.sha1(repr((time.timezone, time.altzone, time.tzname)).encode())
+    for source in (__file__, sys.modules[DataLoader.__module__].__file__):
+        st = os.stat(source)
+        digest.update(f"{st.st_mtime_ns}|{st.st_size}\n".encode())
+
+    try:
+        league_dirs = sorted(os.scandir(loader.leagues_dir), key=lambda e: e.name)
+    except OSError:
+        return ""
+
+    for league_dir in league_dirs:
+        if not league_dir.is_dir():
+            continue
+        paths = [
+            os.path.join(league_dir.path, "metadata.json"),
+            os.path.join(league_dir.path, "league_table.json"),
         ]
-        if day_matches:
-            day_matches.sort(key=lambda m: m.get("date_unix") or 0)
-            result[league_key] = day_matches
-    return result
+        try:
+            with os.scandir(os.path.join(league_dir.path, "matches")) as entries:
+                paths.extend(sorted(e.path for e in entries if e.name.endswith(".json")))
+        except OSError:
+            pass
+
+        for path in paths:
+            try:
+                st = os.stat(path)
+            except OSError:
+                digest.update(f"{path}|-\n".encode())
+                continue
+            digest.update(f"{path}|{st.st_mtime_ns}|{st.st_size}\n".encode())
+
+    return digest.hexdigest()
+
+
+def load_or_build_cache(loader: DataLoader) -> Tuple:
+    """
+    Everything main() needs before the first prompt, reused from
+    <data_dir>/.cache/ when no source file has changed since it was written.
+    Returns:
+        (league_info_map, league_matches, position_maps,
+         date_index, overall_form_map, comp_form_map)
+    """
+    cache_dir = loader.data_dir / ".cache"
+    sig_file = cache_dir / f"{CACHE_NAME}.sig"
+    pkl_file = cache_dir / f"{CACHE_NAME}.pkl"
+
+    signature = _source_signature(loader)
+    try:
+        if signature and sig_file.read_text() == signature:
+            with open(pkl_file, "rb") as f:
+                return pickle.load(f)
+    except Exception:
+        pass  # missing or unreadable cache - rebuild below
+
+    league_info_map, league_matches, position_maps = load_all_league_data(loader)
+    date_index = build_date_index(league_matches)
+    overall_form_map, comp_form_map = build_form_maps(league_matches)
+    bundle = (
+        league_info_map, league_matches, position_maps,
+        date_index, overall_form_map, comp_form_map,
+    )
+
+    # Write the bundle before the signature so a partial write is never trusted
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_file = pkl_file.with_suffix(".tmp")
+        with open(tmp_file, "wb") as f:
+            pickle.dump(bundle, f, protocol=5)
+        os.replace(tmp_file, pkl_file)
+        sig_file.write_text(signature)
+    except OSError:
+        pass
+
+    return bundle
 
 
 # ---------------------------------------------------------------------------
@@ -226,6 +351,15 @@ def get_fixtures_for_date(
 
 # Width of team column (name + position), used to align the form line below
 TEAM_COL_WIDTH = 42
+FORM_COL_WIDTH = TEAM_COL_WIDTH + 10
+
+# Score column is 7 wide; str.center pads odd widths on the other side,
+# so the format-spec layout is kept and the fixed "vs" cell is built once
+MID_FORMAT = "^7"
+VS_CELL = format("vs", MID_FORMAT)
+
+# Indent to match team column start (len("  HH:MM  ") = 9)
+FORM_INDENT = " " * 9
 
 
 def _team_header(name: str, pos: Optional[int]) -> str:
@@ -242,22 +376,25 @@ def _form_str(comp_form: str, overall_form: str) -> str:
     return "  ".join(parts)
 
 
-def _print_fixture(
+def _format_fixture(
     match: Dict,
+    league_key: str,
     pos_map: Dict[int, int],
-    comp_form_map: Dict[int, str],
+    comp_form_map: Dict[Tuple[str, int], str],
     overall_form_map: Dict[int, str],
-) -> None:
+) -> List[str]:
+    """The one or two output lines for a fixture."""
     home_id   = match.get("homeID")
     away_id   = match.get("awayID")
     home_name = match.get("home_name") or match.get("home") or "Unknown"
     away_name = match.get("away_name") or match.get("away") or "Unknown"
 
     ts = match.get("date_unix") or match.get("timestamp") or 0
-    ko = _unix_to_local(ts).strftime("%H:%M") if ts else "--:--"
+    ko = time.strftime("%H:%M", time.localtime(ts)) if ts else "--:--"
 
-    home_pos = pos_map.get(int(home_id)) if home_id is not None else None
-    away_pos = pos_map.get(int(away_id)) if away_id is not None else None
+    # IDs are normalized to int by DataLoader.load_all_matches
+    home_pos = pos_map.get(home_id) if home_id is not None else None
+    away_pos = pos_map.get(away_id) if away_id is not None else None
 
     home_header = _team_header(home_name, home_pos)
     away_header = _team_header(away_name, away_pos)
@@ -266,28 +403,27 @@ def _print_fixture(
     if status == "complete":
         hg = match.get("homeGoalCount", "?")
         ag = match.get("awayGoalCount", "?")
-        mid = f"{hg} - {ag}"
+        mid = format(f"{hg} - {ag}", MID_FORMAT)
     else:
-        mid = "vs"
+        mid = VS_CELL
 
     # Line 1: ko  Home Team (Nth)      score/vs      Away Team (Nth)
-    line1 = f"  {ko}  {home_header:<{TEAM_COL_WIDTH}}  {mid:^7}  {away_header}"
-    print(line1)
+    line1 = f"  {ko}  {home_header.ljust(TEAM_COL_WIDTH)}  {mid}  {away_header}"
 
     # Line 2: form strings, aligned under each team column
-    home_comp    = comp_form_map.get(int(home_id), "") if home_id is not None else ""
-    home_overall = overall_form_map.get(int(home_id), "") if home_id is not None else ""
-    away_comp    = comp_form_map.get(int(away_id), "") if away_id is not None else ""
-    away_overall = overall_form_map.get(int(away_id), "") if away_id is not None else ""
+    home_comp    = comp_form_map.get((league_key, home_id), "") if home_id is not None else ""
+    home_overall = overall_form_map.get(home_id, "") if home_id is not None else ""
+    away_comp    = comp_form_map.get((league_key, away_id), "") if away_id is not None else ""
+    away_overall = overall_form_map.get(away_id, "") if away_id is not None else ""
 
     home_form = _form_str(home_comp, home_overall)
     away_form = _form_str(away_comp, away_overall)
 
     if home_form or away_form:
-        # Indent to match team column start (len("  HH:MM  ") = 9)
-        indent = " " * 9
-        line2 = f"{indent}{home_form:<{TEAM_COL_WIDTH + 10}}  {away_form}"
-        print(line2)
+        line2 = f"{FORM_INDENT}{home_form.ljust(FORM_COL_WIDTH)}  {away_form}"
+        return [line1, line2]
+
+    return [line1]
 
 
 # ---------------------------------------------------------------------------
@@ -297,17 +433,20 @@ def _print_fixture(
 def display_fixtures(
     target_date: date,
     league_info_map: Dict,
-    league_matches: List[Tuple],
     position_maps: Dict,
+    date_index: Dict[date, Dict[str, List[Dict]]],
+    overall_form_map: Dict[int, str],
+    comp_form_map: Dict[Tuple[str, int], str],
 ) -> None:
 
-    fixtures_by_league = get_fixtures_for_date(target_date, league_matches)
-    overall_form_map   = _build_overall_form_map(league_matches)
-    comp_form_maps     = _build_comp_form_maps(league_matches)
+    fixtures_by_league = get_fixtures_for_date(target_date, date_index)
+
+    # Collect every line and write once rather than one print() per line
+    out: List[str] = []
 
     day_label = target_date.strftime("%a %d %B %Y").lstrip("0")
-    print(f"\n{day_label}")
-    print("═" * 70)
+    out.append(f"\n{day_label}")
+    out.append("═" * 70)
 
     # --- Priority leagues ---
     no_fixture_leagues = []
@@ -325,37 +464,39 @@ def display_fixtures(
 
         league_name = league["name"].upper()
         pos_map     = position_maps.get(league_key, {})
-        comp_form   = comp_form_maps.get(league_key, {})
 
-        print(f"\n{league_name}")
+        out.append(f"\n{league_name}")
         for m in matches:
-            _print_fixture(m, pos_map, comp_form, overall_form_map)
+            out.extend(_format_fixture(m, league_key, pos_map, comp_form_map, overall_form_map))
 
     # Collapsed no-fixture line at the bottom of the priority block
     if no_fixture_leagues:
-        print(f"\nNo fixtures today:")
-        print(f"  {' · '.join(no_fixture_leagues)}")
+        out.append(f"\nNo fixtures today:")
+        out.append(f"  {' · '.join(no_fixture_leagues)}")
 
     # --- Rest of world (only shown if they have fixtures) ---
-    rest_keys = sorted(
-        [k for k in fixtures_by_league if k not in PRIORITY_SET],
-        key=lambda k: league_info_map.get(k, {}).get("name", k)
-    )
+    rest_keys = [k for k in fixtures_by_league if k not in PRIORITY_SET]
 
     if rest_keys:
-        print(f"\n{'─' * 70}")
+        # Resolve each display name once rather than inside the sort key
+        rest_names = {k: league_info_map.get(k, {}).get("name", k) for k in rest_keys}
+        rest_keys.sort(key=rest_names.__getitem__)
+
+        out.append(f"\n{'─' * 70}")
         for league_key in rest_keys:
             league      = league_info_map.get(league_key)
             league_name = league["name"].upper() if league else league_key.upper()
             pos_map     = position_maps.get(league_key, {})
-            comp_form   = comp_form_maps.get(league_key, {})
             matches     = fixtures_by_league[league_key]
 
-            print(f"\n{league_name}")
+            out.append(f"\n{league_name}")
             for m in matches:
-                _print_fixture(m, pos_map, comp_form, overall_form_map)
+                out.extend(_format_fixture(m, league_key, pos_map, comp_form_map, overall_form_map))
+
+    out.append(f"\n{'═' * 70}\n")
 
-    print(f"\n{'═' * 70}\n")
+    sys.stdout.write("\n".join(out))
+    sys.stdout.write("\n")
 
 
 # ---------------------------------------------------------------------------
@@ -428,12 +569,19 @@ def main():
     print("\nFIXTURE BROWSER")
 
     print("\nLoading data...", end="", flush=True)
-    league_info_map, league_matches, position_maps = load_all_league_data(loader)
+    # Tables, form and the date index only change with the data on disk
+    (
+        league_info_map, league_matches, position_maps,
+        date_index, overall_form_map, comp_form_map,
+    ) = load_or_build_cache(loader)
     print(" done.")
 
     while True:
         target_date = select_date()
-        display_fixtures(target_date, league_info_map, league_matches, position_maps)
+        display_fixtures(
+            target_date, league_info_map, position_maps,
+            date_index, overall_form_map, comp_form_map,
+        )
 
         again = input("Browse another date? (y/n): ").strip().lower()
         if again != "y":
@@ -2,12 +2,39 @@
 API client with rate limiting and retry logic
 """
 
+import copy
 import requests
 import time
-from typing import Optional, Dict, Any
-from .config import API_KEY, API_BASE_URL, ENDPOINTS
+from typing import Optional, Dict, Any, Tuple
+from requests.adapters import HTTPAdapter
+from .config import API_KEY, API_BASE_URL, ENDPOINTS, HTTP_POOL_SIZE
+from .utils import json_loads
 from .rate_limiter import RateLimiter
 
+_shared_session: Optional[requests.Session] = None
+
+
+def get_shared_session() -> requests.Session:
+    """
+    Process-wide HTTP session for the API host
+    
+    Every APIClient (and so every collector) reuses the same pool of
+    keep-alive connections instead of opening its own.
+    """
+    global _shared_session
+    
+    if _shared_session is None:
+        session = requests.Session()
+        
+        # Single API host: keep a pool of keep-alive connections so concurrent
+        # requests reuse warm TLS connections instead of re-handshaking
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_SIZE)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        _shared_session = session
+    
+    return _shared_session
+
 
 class APIClient:
     """
@@ -18,13 +45,28 @@ class APIClient:
         self.base_url = API_BASE_URL
         self.api_key = API_KEY
         self.rate_limiter = rate_limiter or RateLimiter()
-        self.session = requests.Session()
+        self.session = get_shared_session()
+        
+        # (endpoint, frozen params) -> response, for endpoints fetched with cache=True
+        self._cache: Dict[Tuple, Dict] = {}
         
         # Validate API key exists
         if not self.api_key:
             raise ValueError("API key not found. Please set FOOTYSTATS_API_KEY in .env file")
     
-    def get(self, endpoint: str, params: Optional[Dict] = None, max_retries: int = 3) -> Optional[Dict]:
+    @staticmethod
+    def _cache_key(endpoint: str, params: Optional[Dict]) -> Tuple:
+        """Hashable key for a request (the API key is never part of it)"""
+        if not params:
+            return (endpoint, ())
+        return (endpoint, tuple(sorted((k, v) for k, v in params.items() if k != 'key')))
+    
+    def clear_cache(self):
+        """Drop all cached responses"""
+        self._cache.clear()
+    
+    def get(self, endpoint: str, params: Optional[Dict] = None, max_retries: int = 3,
+            cache: bool = False) -> Optional[Dict]:
         """
         Make a GET request to the API
         
@@ -32,10 +74,19 @@ class APIClient:
             endpoint: API endpoint (can be key from ENDPOINTS or full path)
             params: Additional query parameters
             max_retries: Number of retry attempts on failure
+            cache: Reuse a previous successful response for the same request
+                   instead of spending another rate-limited call
             
         Returns:
             JSON response as dict, or None on failure
         """
+        if cache:
+            cache_key = self._cache_key(endpoint, params)
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                # Callers annotate responses before saving, so hand out a copy
+                return copy.deepcopy(cached)
+        
         # Get full endpoint path if key was provided
         if endpoint in ENDPOINTS:
             endpoint_path = ENDPOINTS[endpoint]
@@ -52,20 +103,22 @@ class APIClient:
             params = {}
         params['key'] = self.api_key
         
-        # Wait if rate limit reached
-        self.rate_limiter.wait_if_needed()
-        
         # Make request with retries
         for attempt in range(max_retries):
             try:
-                response = self.session.get(url, params=params, timeout=30)
+                # Wait if rate limit reached, reserving this attempt's slot
+                self.rate_limiter.acquire()
                 
-                # Record the request
-                self.rate_limiter.record_request()
+                response = self.session.get(url, params=params, timeout=30)
                 
                 # Check for successful response
                 if response.status_code == 200:
-                    return response.json()
+                    # Decode straight from the raw body bytes (orjson when available)
+                    # instead of response.json()'s charset sniffing + text decode
+                    data = json_loads(response.content)
+                    if cache:
+                        self._cache[cache_key] = copy.deepcopy(data)
+                    return data
                 
                 elif response.status_code == 429:
                     # Rate limit hit on server side
@@ -93,7 +146,8 @@ class APIClient:
                     continue
                 return None
             
-            except requests.exceptions.RequestException as e:
+            except (requests.exceptions.RequestException, ValueError) as e:
+                # ValueError: malformed JSON body (response.json() raised a RequestException)
                 print(f"✗ Request error: {e}")
                 if attempt < max_retries - 1:
                     time.sleep(2 ** attempt)
@@ -104,7 +158,7 @@ class APIClient:
     
     def get_league_list(self) -> Optional[Dict]:
         """Convenience method to get league list"""
-        return self.get("league-list")
+        return self.get("league-list", cache=True)
     
     def get_league_stats(self, season_id: int, max_time: Optional[int] = None) -> Optional[Dict]:
         """Get league stats for a season"""
@@ -161,7 +215,7 @@ class APIClient:
         params = {"team_id": team_id}
         if include_stats:
             params["include"] = "stats"
-        return self.get("team", params)
+        return self.get("team", params, cache=True)
     
     def get_team_lastx(self, team_id: int) -> Optional[Dict]:
         """Get last 5/6/10 stats for a team"""
@@ -185,11 +239,11 @@ class APIClient:
     
     def get_btts_stats(self) -> Optional[Dict]:
         """Get BTTS statistics"""
-        return self.get("btts_stats")
+        return self.get("btts_stats", cache=True)
     
     def get_over25_stats(self) -> Optional[Dict]:
         """Get Over 2.5 statistics"""
-        return self.get("over25_stats")
+        return self.get("over25_stats", cache=True)
     
     def get_rate_limit_status(self) -> Dict:
         """Get current rate limit status"""
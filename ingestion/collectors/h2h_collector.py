@@ -4,11 +4,15 @@ Generates H2H stats from match data (no API calls needed)
 """
 
 from typing import List, Dict
-from itertools import combinations
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from ..data_manager import DataManager
 from ..state_manager import IngestionState
 from ..utils import calculate_h2h_stats
 
+# Match files are independent disk reads, so overlap them
+MATCH_LOAD_WORKERS = 16
+
 
 class H2HCollector:
     """
@@ -41,48 +45,58 @@ class H2HCollector:
             print("  ⚠ Not enough teams for H2H generation")
             return False
         
-        # Get all matches
+        # Stream matches from the loader threads straight into buckets keyed
+        # by unordered team pair, so only pairs that actually played are
+        # visited and no full match list is held alongside the buckets
         match_ids = self.data_manager.get_all_match_ids()
-        all_matches = []
+        known_teams = set(team_ids)
+        pair_matches = defaultdict(list)
+        match_count = 0
         
-        for match_id in match_ids:
-            match = self.data_manager.load_match(match_id)
-            if match:
-                all_matches.append(match)
+        with ThreadPoolExecutor(max_workers=MATCH_LOAD_WORKERS) as executor:
+            for match in executor.map(self.data_manager.load_match, match_ids):
+                if not match:
+                    continue
+                match_count += 1
+                
+                home_id = match.get('homeID')
+                away_id = match.get('awayID')
+                
+                if home_id == away_id or home_id not in known_teams or away_id not in known_teams:
+                    continue
+                
+                pair = (home_id, away_id) if home_id < away_id else (away_id, home_id)
+                pair_matches[pair].append(match)
         
-        if not all_matches:
+        if not match_count:
             print("  ⚠ No matches found for H2H generation")
             return False
         
         # Generate H2H for each team pair
         h2h_count = 0
-        team_pairs = list(combinations(team_ids, 2))
         
-        print(f"  Processing {len(team_pairs)} team pairs...")
+        print(f"  Processing {len(pair_matches)} team pairs...")
         
-        for team_a_id, team_b_id in team_pairs:
-            # Find matches between these two teams
-            h2h_matches = [
-                match for match in all_matches
-                if (match.get('homeID') == team_a_id and match.get('awayID') == team_b_id) or
-                   (match.get('homeID') == team_b_id and match.get('awayID') == team_a_id)
-            ]
+        for team_a_id, team_b_id in sorted(pair_matches):
+            h2h_matches = pair_matches[team_a_id, team_b_id]
             
-            if h2h_matches:
-                # Calculate H2H stats
-                h2h_stats = calculate_h2h_stats(h2h_matches, team_a_id, team_b_id)
-                
-                # Add metadata
-                h2h_data = {
-                    'team_a_id': team_a_id,
-                    'team_b_id': team_b_id,
-                    'matches': h2h_matches,
-                    'stats': h2h_stats
-                }
-                
-                # Save H2H data (overwrites existing to include new matches)
-                self.data_manager.save_h2h(team_a_id, team_b_id, h2h_data)
-                h2h_count += 1
+            # Calculate H2H stats
+            h2h_stats = calculate_h2h_stats(h2h_matches, team_a_id, team_b_id)
+            
+            # Add metadata
+            h2h_data = {
+                'team_a_id': team_a_id,
+                'team_b_id': team_b_id,
+                'matches': h2h_matches,
+                'stats': h2h_stats
+            }
+            
+            # Save H2H data (rewrites existing files whose matches changed)
+            self.data_manager.save_h2h(team_a_id, team_b_id, h2h_data)
+            h2h_count += 1
+        
+        # Unchanged pairs were skipped; persist the hashes of the rewritten ones
+        self.data_manager.flush_content_hashes()
         
         # Update state
         self.state.state['collections']['h2h']['generated'] = h2h_count
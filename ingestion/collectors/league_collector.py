@@ -2,6 +2,7 @@
 Collector for league-level data (stats, table)
 """
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional, Dict
 from ..api_client import APIClient
 from ..data_manager import DataManager
@@ -18,10 +19,13 @@ class LeagueCollector:
         self.data_manager = data_manager
         self.state = state
     
-    def collect_league_stats(self) -> bool:
+    def collect_league_stats(self, prefetched: Optional[Future] = None) -> bool:
         """
         Collect league season stats
         
+        Args:
+            prefetched: Future for an already submitted get_league_stats request
+        
         Returns:
             True if successful, False otherwise
         """
@@ -34,7 +38,10 @@ class LeagueCollector:
         self.state.mark_collection_in_progress('league_stats')
         
         # Fetch from API
-        response = self.api_client.get_league_stats(self.state.season_id)
+        if prefetched is not None:
+            response = prefetched.result()
+        else:
+            response = self.api_client.get_league_stats(self.state.season_id)
         
         if not response or not response.get('success'):
             print("  ✗ Failed to fetch league stats")
@@ -55,10 +62,13 @@ class LeagueCollector:
             print("  ⚠ No league stats data returned")
             return False
     
-    def collect_league_table(self) -> bool:
+    def collect_league_table(self, prefetched: Optional[Future] = None) -> bool:
         """
         Collect league table/standings
         
+        Args:
+            prefetched: Future for an already submitted get_league_table request
+        
         Returns:
             True if successful, False otherwise
         """
@@ -71,7 +81,10 @@ class LeagueCollector:
         self.state.mark_collection_in_progress('league_table')
         
         # Fetch from API
-        response = self.api_client.get_league_table(self.state.season_id, include_stats=True)
+        if prefetched is not None:
+            response = prefetched.result()
+        else:
+            response = self.api_client.get_league_table(self.state.season_id, include_stats=True)
         
         if not response or not response.get('success'):
             print("  ✗ Failed to fetch league table")
@@ -99,7 +112,15 @@ class LeagueCollector:
         """
         print("\n📊 Collecting league data...")
         
-        stats_ok = self.collect_league_stats()
-        table_ok = self.collect_league_table()
+        # The two requests are independent, so both are in flight at once;
+        # saving and state updates still happen here, one after the other
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            stats_future = executor.submit(self.api_client.get_league_stats, self.state.season_id)
+            table_future = executor.submit(
+                self.api_client.get_league_table, self.state.season_id, include_stats=True
+            )
+            
+            stats_ok = self.collect_league_stats(stats_future)
+            table_ok = self.collect_league_table(table_future)
         
         return stats_ok and table_ok
\ No newline at end of file
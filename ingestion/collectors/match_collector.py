@@ -2,8 +2,10 @@
 Collector for match data
 """
 
-from typing import List, Set
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Set
 from ..api_client import APIClient
+from ..config import PROGRESS_SAVE_PAGES
 from ..data_manager import DataManager
 from ..state_manager import IngestionState
 
@@ -36,63 +38,94 @@ class MatchCollector:
         all_match_ids = set()
         page = 1
         api_calls = 0
+        api_calls_saved = 0
+        pages_unsaved = 0
         new_count = 0
         updated_count = 0
         
         # Get already fetched match IDs from disk
         existing_from_disk = set(self.data_manager.get_all_match_ids())
         
-        while True:
-            response = self.api_client.get_league_matches(
-                self.state.season_id,
-                page=page,
-                max_per_page=500
-            )
-            api_calls += 1
-            
-            if not response or not response.get('success'):
-                print(f"  ✗ Failed to fetch matches (page {page})")
-                break
-            
-            data = response.get('data', [])
-            if not data:
-                break
+        # Running union of existing_from_disk and all_match_ids
+        known_ids = set(existing_from_disk)
+        
+        # One page is always in flight while the previous one is processed
+        with ThreadPoolExecutor(max_workers=1) as prefetcher:
+            response = self._fetch_page(page)
             
-            # Save ALL matches (new and existing) to capture status updates
-            for match in data:
-                match_id = match.get('id')
+            while True:
+                api_calls += 1
                 
-                # Determine if this is new or an update
-                if match_id in existing_from_disk:
-                    updated_count += 1
-                else:
-                    new_count += 1
+                if not response or not response.get('success'):
+                    print(f"  ✗ Failed to fetch matches (page {page})")
+                    break
                 
-                # Always save to capture any updates (especially status changes)
-                self.data_manager.save_match(match_id, match)
-                all_match_ids.add(match_id)
-            
-            # Progress update
-            if data:
-                print(f"    ✓ Page {page}: {len(data)} matches processed")
-            
-            # Update state
+                data = response.get('data', [])
+                if not data:
+                    break
+                
+                # Start fetching the next page while this one is being saved
+                pager = response.get('pager') or {}
+                has_next_page = page < pager.get('max_page', 1)
+                if has_next_page:
+                    next_response = prefetcher.submit(self._fetch_page, page + 1)
+                
+                # Count new vs updated matches; ALL of them are saved below
+                for match in data:
+                    match_id = match.get('id')
+                    
+                    # Determine if this is new or an update
+                    if match_id in existing_from_disk:
+                        updated_count += 1
+                    else:
+                        new_count += 1
+                    
+                    all_match_ids.add(match_id)
+                    known_ids.add(match_id)
+                
+                # Save to capture any updates (especially status changes); records
+                # whose content hash is unchanged are skipped, and one batch per
+                # page also persists the match status index
+                self.data_manager.save_matches_bulk(data)
+                
+                # Progress update
+                if data:
+                    print(f"    ✓ Page {page}: {len(data)} matches processed")
+                
+                # Update state every few pages (each update rewrites the state
+                # file and re-merges the ID list); the rest is flushed below
+                pages_unsaved += 1
+                if pages_unsaved >= PROGRESS_SAVE_PAGES or not has_next_page:
+                    self.state.update_collection_progress(
+                        'matches',
+                        fetched=len(known_ids),
+                        total=len(known_ids),
+                        ids=all_match_ids,
+                        api_calls=api_calls - api_calls_saved
+                    )
+                    api_calls_saved = api_calls
+                    pages_unsaved = 0
+                
+                if not has_next_page:
+                    break
+                
+                page += 1
+                response = next_response.result()
+        
+        # Pages processed since the last update (the loop stopped early)
+        if pages_unsaved:
             self.state.update_collection_progress(
                 'matches',
-                fetched=len(all_match_ids.union(existing_from_disk)),
-                total=len(all_match_ids.union(existing_from_disk)),
-                ids=list(all_match_ids),
-                api_calls=api_calls
+                fetched=len(known_ids),
+                total=len(known_ids),
+                ids=all_match_ids,
+                api_calls=api_calls - api_calls_saved
             )
-            
-            # Check if there are more pages
-            pager = response.get('pager', {})
-            if page >= pager.get('max_page', 1):
-                break
-            
-            page += 1
         
-        total_matches = len(all_match_ids.union(existing_from_disk))
+        # Rebuild the gameweek summary DataLoader reads, once all pages are saved
+        self.data_manager.write_gameweek_summary()
+            
+        total_matches = len(known_ids)
         
         if new_count > 0 or updated_count > 0:
             print(f"  ✓ Matches: {total_matches} total ({new_count} new, {updated_count} updated)")
@@ -106,6 +139,14 @@ class MatchCollector:
             print("  ⚠ No matches data returned")
             return False
     
+    def _fetch_page(self, page: int) -> Optional[Dict]:
+        """Fetch one page of league matches"""
+        return self.api_client.get_league_matches(
+            self.state.season_id,
+            page=page,
+            max_per_page=500
+        )
+    
     def collect_all(self) -> bool:
         """
         Collect all match data
@@ -3,10 +3,13 @@ Collector for detailed match data
 Fetches in-depth match statistics for completed matches only
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Set
 from ..api_client import APIClient
+from ..config import API_WORKERS
 from ..data_manager import DataManager
 from ..state_manager import IngestionState
+from ..utils import map_bounded
 
 
 class MatchDetailsCollector:
@@ -41,12 +44,13 @@ class MatchDetailsCollector:
             print("  ⚠ No matches found")
             return False
         
-        # Filter to completed matches only
-        completed_match_ids = []
-        for match_id in all_match_ids:
-            match = self.data_manager.load_match(match_id)
-            if match and match.get('status') == 'complete':
-                completed_match_ids.append(match_id)
+        # Filter to completed matches only (statuses come from the index,
+        # not from parsing every match file)
+        match_statuses = self.data_manager.get_match_statuses()
+        completed_match_ids = [
+            match_id for match_id, status in match_statuses.items()
+            if status == 'complete'
+        ]
         
         if not completed_match_ids:
             print("  ℹ No completed matches to collect details for")
@@ -58,8 +62,9 @@ class MatchDetailsCollector:
         existing_from_disk = set(self.data_manager.get_all_match_detail_ids())
         already_fetched = existing.union(existing_from_disk)
         
-        # Find new matches to collect
-        matches_to_fetch = [mid for mid in completed_match_ids if mid not in already_fetched]
+        # Find new matches to collect (set difference runs in C; sorting restores
+        # the match ID order completed_match_ids is already in)
+        matches_to_fetch = sorted(set(completed_match_ids).difference(already_fetched))
         
         if not matches_to_fetch:
             print(f"  ✓ All {len(completed_match_ids)} completed matches already have details")
@@ -73,46 +78,41 @@ class MatchDetailsCollector:
         fetched_count = len(already_fetched)
         api_calls = 0
         
-        for idx, match_id in enumerate(matches_to_fetch, 1):
-            # Load basic match data for display
-            match = self.data_manager.load_match(match_id)
-            if not match:
-                continue
+        # Requests are latency bound, so keep several in flight; results come
+        # back in order and are saved here on the calling thread
+        with ThreadPoolExecutor(max_workers=API_WORKERS) as executor:
+            responses = map_bounded(executor, self.api_client.get_match, matches_to_fetch, API_WORKERS * 2)
             
-            home_name = match.get('home_name', 'Unknown')
-            away_name = match.get('away_name', 'Unknown')
-            
-            # Fetch detailed match data
-            response = self.api_client.get_match(match_id)
-            api_calls += 1
-            
-            if response and response.get('success'):
-                data = response.get('data', {})
-                if data:
-                    # Save match details
-                    self.data_manager.save_match_details(match_id, data)
-                    fetched_count += 1
-                    already_fetched.add(match_id)
-                    
-                    if idx % 10 == 0 or idx == len(matches_to_fetch):
-                        print(f"    ✓ {idx}/{len(matches_to_fetch)} match details collected")
-            
-            # Update state periodically
-            if api_calls % 10 == 0:
-                self.state.update_collection_progress(
-                    'match_details',
-                    fetched=fetched_count,
-                    total=len(completed_match_ids),
-                    ids=list(already_fetched),
-                    api_calls=api_calls
-                )
+            for idx, (match_id, response) in enumerate(zip(matches_to_fetch, responses), 1):
+                api_calls += 1
+                
+                if response and response.get('success'):
+                    data = response.get('data', {})
+                    if data:
+                        # Save match details
+                        self.data_manager.save_match_details(match_id, data)
+                        fetched_count += 1
+                        already_fetched.add(match_id)
+                        
+                        if idx % 10 == 0 or idx == len(matches_to_fetch):
+                            print(f"    ✓ {idx}/{len(matches_to_fetch)} match details collected")
+                
+                # Update state periodically
+                if api_calls % 10 == 0:
+                    self.state.update_collection_progress(
+                        'match_details',
+                        fetched=fetched_count,
+                        total=len(completed_match_ids),
+                        ids=already_fetched,
+                        api_calls=api_calls
+                    )
         
         # Final update
         self.state.update_collection_progress(
             'match_details',
             fetched=fetched_count,
             total=len(completed_match_ids),
-            ids=list(already_fetched),
+            ids=already_fetched,
             api_calls=api_calls
         )
         
@@ -2,13 +2,25 @@
 Collector for player data
 """
 
-from typing import List, Set
+from array import array
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Set
 from ..api_client import APIClient
+from ..config import PROGRESS_SAVE_PAGES
 from ..data_manager import DataManager
 from ..state_manager import IngestionState
 from ..utils import get_player_name_from_data
 
 
+def _contains(sorted_ids: array, value: Any) -> bool:
+    """Membership test on a sorted array of IDs"""
+    if not isinstance(value, int):
+        return False
+    index = bisect_left(sorted_ids, value)
+    return index < len(sorted_ids) and sorted_ids[index] == value
+
+
 class PlayerCollector:
     """
     Collects player data
@@ -37,63 +49,95 @@ class PlayerCollector:
         all_player_ids = set()
         page = 1
         api_calls = 0
+        api_calls_saved = 0
+        pages_unsaved = 0
         new_count = 0
         updated_count = 0
         
-        # Get already fetched player IDs from disk
-        existing_from_disk = set(self.data_manager.get_all_player_ids())
+        # Already fetched player IDs from disk, kept as a packed sorted array
+        # (8 bytes per ID instead of a set of int objects) and probed by bisect
+        existing_from_disk = array('q', dict.fromkeys(self.data_manager.get_all_player_ids()))
         
-        while True:
-            response = self.api_client.get_league_players(
-                self.state.season_id,
-                page=page
-            )
-            api_calls += 1
-            
-            if not response or not response.get('success'):
-                print(f"  ✗ Failed to fetch players (page {page})")
-                break
-            
-            data = response.get('data', [])
-            if not data:
-                break
+        # IDs seen this run that weren't on disk; together with existing_from_disk
+        # they make up every known player
+        new_ids = set()
+        
+        # One page is always in flight while the previous one is processed
+        with ThreadPoolExecutor(max_workers=1) as prefetcher:
+            response = self._fetch_page(page)
             
-            # Save ALL players (new and existing) to capture stats updates
-            for player in data:
-                player_id = player.get('id')
-                player_name = get_player_name_from_data(player)
+            while True:
+                api_calls += 1
                 
-                # Determine if this is new or an update
-                if player_id in existing_from_disk:
-                    updated_count += 1
-                else:
-                    new_count += 1
+                if not response or not response.get('success'):
+                    print(f"  ✗ Failed to fetch players (page {page})")
+                    break
                 
-                # Always save to capture stat updates (goals, assists, cards, etc.)
-                self.data_manager.save_player(player_id, player_name, player)
-                all_player_ids.add(player_id)
-            
-            # Progress update
-            if data:
-                print(f"    ✓ Page {page}: {len(data)} players processed")
-            
-            # Update state
+                data = response.get('data', [])
+                if not data:
+                    break
+                
+                # Start fetching the next page while this one is being saved
+                pager = response.get('pager') or {}
+                has_next_page = page < pager.get('max_page', 1)
+                if has_next_page:
+                    next_response = prefetcher.submit(self._fetch_page, page + 1)
+                
+                # Save ALL players (new and existing) to capture stats updates
+                page_players = []
+                for player in data:
+                    player_id = player.get('id')
+                    player_name = get_player_name_from_data(player)
+                    
+                    # Determine if this is new or an update
+                    if _contains(existing_from_disk, player_id):
+                        updated_count += 1
+                    else:
+                        new_count += 1
+                        new_ids.add(player_id)
+                    
+                    page_players.append((player_id, player_name, player))
+                    all_player_ids.add(player_id)
+                
+                # Save to capture stat updates (goals, assists, cards, etc.);
+                # players whose content hash is unchanged are skipped
+                self.data_manager.save_players_bulk(page_players)
+                
+                # Progress update
+                if data:
+                    print(f"    ✓ Page {page}: {len(data)} players processed")
+                
+                # Update state every few pages (each update rewrites the state
+                # file and re-merges the ID list); the rest is flushed below
+                pages_unsaved += 1
+                if pages_unsaved >= PROGRESS_SAVE_PAGES or not has_next_page:
+                    self.state.update_collection_progress(
+                        'players',
+                        fetched=len(existing_from_disk) + len(new_ids),
+                        total=len(existing_from_disk) + len(new_ids),
+                        ids=all_player_ids,
+                        api_calls=api_calls - api_calls_saved
+                    )
+                    api_calls_saved = api_calls
+                    pages_unsaved = 0
+                
+                if not has_next_page:
+                    break
+                
+                page += 1
+                response = next_response.result()
+        
+        # Pages processed since the last update (the loop stopped early)
+        if pages_unsaved:
             self.state.update_collection_progress(
                 'players',
-                fetched=len(all_player_ids.union(existing_from_disk)),
-                total=len(all_player_ids.union(existing_from_disk)),
-                ids=list(all_player_ids),
-                api_calls=api_calls
+                fetched=len(existing_from_disk) + len(new_ids),
+                total=len(existing_from_disk) + len(new_ids),
+                ids=all_player_ids,
+                api_calls=api_calls - api_calls_saved
             )
             
-            # Check if there are more pages
-            pager = response.get('pager', {})
-            if page >= pager.get('max_page', 1):
-                break
-            
-            page += 1
-        
-        total_players = len(all_player_ids.union(existing_from_disk))
+        total_players = len(existing_from_disk) + len(new_ids)
         
         if new_count > 0 or updated_count > 0:
             print(f"  ✓ Players: {total_players} total ({new_count} new, {updated_count} updated)")
@@ -107,6 +151,13 @@ class PlayerCollector:
             print("  ⚠ No players data returned")
             return False
     
+    def _fetch_page(self, page: int) -> Optional[Dict]:
+        """Fetch one page of league players"""
+        return self.api_client.get_league_players(
+            self.state.season_id,
+            page=page
+        )
+    
     def collect_all(self) -> bool:
         """
         Collect all player data
@@ -63,16 +63,17 @@ class RefereeCollector:
             
             self.data_manager.save_referee(referee_id, referee_name, referee)
             already_fetched.add(referee_id)
-            
-            print(f"    ✓ Saved {referee_name}")
+        
+        # One summary line rather than a console write per referee
+        if new_referees:
+            print(f"    ✓ Saved {len(new_referees)} referees")
         
         # Update state
-        referee_ids = list(already_fetched)
         self.state.update_collection_progress(
             'referees',
             fetched=len(already_fetched),
             total=len(already_fetched),
-            ids=referee_ids,
+            ids=already_fetched,
             api_calls=api_calls
         )
         
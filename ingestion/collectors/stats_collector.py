@@ -2,6 +2,8 @@
 Collector for global stats (BTTS, Over 2.5)
 """
 
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional
 from ..api_client import APIClient
 from ..data_manager import GlobalDataManager
 
@@ -14,16 +16,22 @@ class StatsCollector:
     def __init__(self, api_client: APIClient):
         self.api_client = api_client
     
-    def collect_btts_stats(self) -> bool:
+    def collect_btts_stats(self, prefetched: Optional[Future] = None) -> bool:
         """
         Collect BTTS statistics
         
+        Args:
+            prefetched: Future for an already submitted get_btts_stats request
+        
         Returns:
             True if successful, False otherwise
         """
         print("  Fetching BTTS stats...")
         
-        response = self.api_client.get_btts_stats()
+        if prefetched is not None:
+            response = prefetched.result()
+        else:
+            response = self.api_client.get_btts_stats()
         
         if not response or not response.get('success'):
             print("  ✗ Failed to fetch BTTS stats")
@@ -35,16 +43,22 @@ class StatsCollector:
         
         return True
     
-    def collect_over25_stats(self) -> bool:
+    def collect_over25_stats(self, prefetched: Optional[Future] = None) -> bool:
         """
         Collect Over 2.5 statistics
         
+        Args:
+            prefetched: Future for an already submitted get_over25_stats request
+        
         Returns:
             True if successful, False otherwise
         """
         print("  Fetching Over 2.5 stats...")
         
-        response = self.api_client.get_over25_stats()
+        if prefetched is not None:
+            response = prefetched.result()
+        else:
+            response = self.api_client.get_over25_stats()
         
         if not response or not response.get('success'):
             print("  ✗ Failed to fetch Over 2.5 stats")
@@ -65,7 +79,13 @@ class StatsCollector:
         """
         print("\n📈 Collecting global stats...")
         
-        btts_ok = self.collect_btts_stats()
-        over25_ok = self.collect_over25_stats()
+        # Both requests are independent, so fetch them concurrently and
+        # save the results here in the usual order
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            btts_future = executor.submit(self.api_client.get_btts_stats)
+            over25_future = executor.submit(self.api_client.get_over25_stats)
+            
+            btts_ok = self.collect_btts_stats(btts_future)
+            over25_ok = self.collect_over25_stats(over25_future)
         
         return btts_ok and over25_ok
\ No newline at end of file
@@ -2,11 +2,13 @@
 Collector for team data
 """
 
-from typing import List, Set
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
 from ..api_client import APIClient
+from ..config import API_WORKERS
 from ..data_manager import DataManager
 from ..state_manager import IngestionState
-from ..utils import get_team_name_from_data
+from ..utils import get_team_name_from_data, map_bounded
 
 
 class TeamCollector:
@@ -18,6 +20,10 @@ class TeamCollector:
         self.api_client = api_client
         self.data_manager = data_manager
         self.state = state
+        
+        # {team_id: name} of teams saved by collect_league_teams, so the
+        # lastX pass doesn't reload those team files just for the name
+        self._team_names: Dict[int, str] = {}
     
     def collect_league_teams(self) -> bool:
         """
@@ -34,7 +40,7 @@ class TeamCollector:
         print("  Fetching teams...")
         self.state.mark_collection_in_progress('teams')
         
-        all_teams = []
+        team_ids = []
         page = 1
         api_calls = 0
         
@@ -59,6 +65,10 @@ class TeamCollector:
             if not data:
                 break
             
+            # Read the pager once, up front, as the match/player collectors do
+            pager = response.get('pager') or {}
+            has_next_page = page < pager.get('max_page', 1)
+            
             # Filter out already fetched teams
             new_teams = [team for team in data if team.get('id') not in already_fetched]
             
@@ -68,13 +78,15 @@ class TeamCollector:
                 team_name = get_team_name_from_data(team)
                 
                 self.data_manager.save_team(team_id, team_name, team)
-                all_teams.append(team)
+                self._team_names[team_id] = team_name
+                team_ids.append(team_id)
                 already_fetched.add(team_id)
-                
-                print(f"    ✓ Saved {team_name}")
             
-            # Update state
-            team_ids = [t.get('id') for t in all_teams]
+            # One summary line per page rather than a console write per team
+            if new_teams:
+                print(f"    ✓ Saved {len(new_teams)} teams (page {page})")
+            
+            # Update state (team_ids is kept up to date in the save loop)
             self.state.update_collection_progress(
                 'teams',
                 fetched=len(already_fetched),
@@ -83,14 +95,12 @@ class TeamCollector:
                 api_calls=api_calls
             )
             
-            # Check if there are more pages
-            pager = response.get('pager', {})
-            if page >= pager.get('max_page', 1):
+            if not has_next_page:
                 break
             
             page += 1
         
-        if all_teams or already_fetched:
+        if team_ids or already_fetched:
             print(f"  ✓ Teams collected: {len(already_fetched)} total")
             self.state.mark_collection_complete('teams')
             return True
@@ -127,52 +137,70 @@ class TeamCollector:
         fetched_count = 0
         api_calls = 0
         
-        for team_id in teams_to_fetch:
-            # Load team to get name
-            team_data = self.data_manager.load_team(team_id)
-            if not team_data:
-                continue
+        # Requests are latency bound, so keep several in flight; results come
+        # back in order and are saved here on the calling thread
+        with ThreadPoolExecutor(max_workers=API_WORKERS) as executor:
+            results = map_bounded(executor, self._fetch_team_lastx, teams_to_fetch, API_WORKERS * 2)
             
-            team_name = get_team_name_from_data(team_data)
-            
-            # Fetch lastX stats
-            response = self.api_client.get_team_lastx(team_id)
-            api_calls += 1
-            
-            if response and response.get('success'):
-                data = response.get('data', [])
-                if data:
-                    # Save all lastX variations (last 5, 6, 10)
-                    self.data_manager.save_team_lastx(team_id, team_name, data)
-                    fetched_count += 1
-                    existing.add(team_id)
-                    
-                    if fetched_count % 5 == 0 or fetched_count == len(teams_to_fetch):
-                        print(f"    ✓ Refreshed {fetched_count}/{len(teams_to_fetch)} teams")
-            
-            # Update state periodically
-            if api_calls % 5 == 0:
-                self.state.update_collection_progress(
-                    'team_lastx',
-                    fetched=fetched_count,
-                    total=len(team_ids),
-                    ids=list(existing),
-                    api_calls=api_calls
-                )
+            for team_id, team_name, response in results:
+                # Teams without a saved team file are skipped
+                if team_name is None:
+                    continue
+                api_calls += 1
+                
+                if response and response.get('success'):
+                    data = response.get('data', [])
+                    if data:
+                        # Save all lastX variations (last 5, 6, 10)
+                        self.data_manager.save_team_lastx(team_id, team_name, data)
+                        fetched_count += 1
+                        existing.add(team_id)
+                        
+                        if fetched_count % 5 == 0 or fetched_count == len(teams_to_fetch):
+                            print(f"    ✓ Refreshed {fetched_count}/{len(teams_to_fetch)} teams")
+                
+                # Update state periodically
+                if api_calls % 5 == 0:
+                    self.state.update_collection_progress(
+                        'team_lastx',
+                        fetched=fetched_count,
+                        total=len(team_ids),
+                        ids=existing,
+                        api_calls=api_calls
+                    )
         
         # Final update
         self.state.update_collection_progress(
             'team_lastx',
             fetched=fetched_count,
             total=len(team_ids),
-            ids=list(existing),
+            ids=existing,
             api_calls=api_calls
         )
         
+        self.data_manager.flush_content_hashes()
+        
         print(f"  ✓ Team lastX stats refreshed: {fetched_count}/{len(team_ids)}")
         self.state.mark_collection_complete('team_lastx')
         return True
     
+    def _fetch_team_lastx(self, team_id: int) -> Tuple[int, Optional[str], Optional[Dict]]:
+        """
+        Fetch last X stats for one team (runs on a worker thread)
+        
+        Returns:
+            (team_id, team name or None if the team isn't saved, API response)
+        """
+        # Teams saved this run already have their name; load the rest
+        team_name = self._team_names.get(team_id)
+        if team_name is None:
+            team_data = self.data_manager.load_team(team_id)
+            if not team_data:
+                return team_id, None, None
+            team_name = get_team_name_from_data(team_data)
+        
+        return team_id, team_name, self.api_client.get_team_lastx(team_id)
+    
     def collect_all(self) -> bool:
         """
         Collect all team data
@@ -14,6 +14,9 @@ load_dotenv()
 API_KEY = os.getenv("FOOTYSTATS_API_KEY")
 API_BASE_URL = os.getenv("API_BASE_URL", "https://api.football-data-api.com")
 REQUESTS_PER_HOUR = int(os.getenv("REQUESTS_PER_HOUR", 1800))
+HTTP_POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", 8))
+API_WORKERS = int(os.getenv("API_WORKERS", HTTP_POOL_SIZE))
+PROGRESS_SAVE_PAGES = int(os.getenv("PROGRESS_SAVE_PAGES", 5))
 
 # Data directories
 DATA_DIR = Path(os.getenv("DATA_DIR", "./data"))
@@ -22,6 +25,10 @@ LEAGUES_DIR = DATA_DIR / "leagues"
 STATS_DIR = DATA_DIR / "stats"
 STATE_DIR = DATA_DIR / "ingestion_state"
 
+# Write data files without indentation: markedly smaller files and less disk
+# I/O, and every reader parses them the same way
+COMPACT_JSON = os.getenv("COMPACT_JSON", "").lower() in ("1", "true", "yes")
+
 # Create directories if they don't exist
 for directory in [DATA_DIR, RAW_DATA_DIR, LEAGUES_DIR, STATS_DIR, STATE_DIR]:
     directory.mkdir(parents=True, exist_ok=True)
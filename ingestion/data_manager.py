@@ -3,11 +3,50 @@ Data manager for storing and retrieving ingested data
 Handles JSON file I/O, deduplication, and data organization
 """
 
-import json
+import hashlib
+import os
+import re
+import sys
+import threading
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set, Tuple, Union
 from datetime import datetime
 from .config import LEAGUES_DIR, STATS_DIR, STATE_DIR
+from .utils import json_loads, json_dumps_bytes, json_dumps_compact
+
+# Concurrent file writes for batch saves (independent small files)
+SAVE_WORKERS = 8
+
+# Concurrent file reads for bulk loads (file reads and orjson parsing release the GIL)
+LOAD_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Parsed match files kept by load_match (least recently used evicted first)
+MATCH_CACHE_SIZE = 1024
+
+# Parsed single-record files (team, player, league stats, ...) kept by the
+# read cache, revalidated against the file's mtime/size on every hit
+READ_CACHE_SIZE = 2048
+
+
+# Anything but alphanumerics, '_' and '-' (\w matches exactly str.isalnum() plus '_')
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^\w-]')
+
+
+@lru_cache(maxsize=4096)
+def _sanitize_name(name: str) -> str:
+    """Cached body of DataManager._sanitize_filename (names repeat across saves)"""
+    return _UNSAFE_FILENAME_CHARS.sub('', name.replace(' ', '_')).lower()[:50]
+
+
+def content_hash(data: Any) -> str:
+    """Short digest of a record's content, ignoring its '_saved_at' stamp"""
+    if isinstance(data, dict) and '_saved_at' in data:
+        data = {k: v for k, v in data.items() if k != '_saved_at'}
+    return hashlib.blake2b(json_dumps_compact(data), digest_size=8).hexdigest()
 
 
 class DataManager:
@@ -15,14 +54,16 @@ class DataManager:
     Manages data storage and retrieval
     """
     
+    # League directories whose subdirectory tree was created this process
+    _prepared_dirs: Set[Path] = set()
+    
     def __init__(self, league_key: str, season_id: int, season_year: str):
         self.league_key = league_key
         self.season_id = season_id
         self.season_year = season_year
         
-        # Create league-specific directory
+        # League-specific directory
         self.league_dir = LEAGUES_DIR / f"{league_key}_{season_id}"
-        self.league_dir.mkdir(parents=True, exist_ok=True)
         
         # Create subdirectories
         self.teams_dir = self.league_dir / "teams"
@@ -32,186 +73,592 @@ class DataManager:
         self.referees_dir = self.league_dir / "referees"
         self.h2h_dir = self.league_dir / "h2h"
         
-        for directory in [self.teams_dir, self.matches_dir, self.match_details_dir,
-                         self.players_dir, self.referees_dir, self.h2h_dir]:
-            directory.mkdir(parents=True, exist_ok=True)
+        # Create the tree once per process; the league directory is made
+        # first, so the subdirectories don't need their ancestors walked
+        if self.league_dir not in DataManager._prepared_dirs:
+            self.league_dir.mkdir(parents=True, exist_ok=True)
+            for directory in [self.teams_dir, self.matches_dir, self.match_details_dir,
+                             self.players_dir, self.referees_dir, self.h2h_dir]:
+                directory.mkdir(exist_ok=True)
+            DataManager._prepared_dirs.add(self.league_dir)
+        
+        # Directory prefixes as plain strings: per-record file paths are built
+        # by concatenation, not Path joins, since thousands are made per run
+        self._league_dir_s = os.path.join(self.league_dir, '')
+        self._teams_dir_s = os.path.join(self.teams_dir, '')
+        self._matches_dir_s = os.path.join(self.matches_dir, '')
+        self._match_details_dir_s = os.path.join(self.match_details_dir, '')
+        self._players_dir_s = os.path.join(self.players_dir, '')
+        self._referees_dir_s = os.path.join(self.referees_dir, '')
+        self._h2h_dir_s = os.path.join(self.h2h_dir, '')
+        
+        # {match_id: status} index so status filters don't parse every match file.
+        # Loaded lazily, updated by save_match, persisted by flush_match_statuses
+        self.match_status_file = self.league_dir / "_match_statuses.json"
+        self._match_statuses: Optional[Dict[int, Optional[str]]] = None
+        self._match_statuses_dirty = False
+        
+        # Gameweek summary read by betting.DataLoader (max/completed/next
+        # gameweek), dropped when matches are saved and rebuilt once per
+        # collection run by write_gameweek_summary
+        self.gameweek_summary_file = self.league_dir / "_gameweek_summary.json"
+        self._gameweek_summary_stale = False
+        
+        # Directory listings of match/detail IDs, scanned once and then kept
+        # current by the save methods (this manager is the only writer)
+        self._match_ids: Optional[Set[int]] = None
+        self._match_detail_ids: Optional[Set[int]] = None
+        
+        # Detail IDs persisted as packed int64s, appended on every detail save,
+        # so a warm start reads one small file instead of listing the directory
+        self.match_detail_index_file = self.league_dir / "_match_detail_ids.bin"
+        
+        # LRU of parsed matches for repeat load_match calls (e.g. the status
+        # index backfill followed by H2H); load_match runs on worker threads
+        self._match_cache: OrderedDict = OrderedDict()
+        self._match_cache_lock = threading.Lock()
+        
+        # LRU of other parsed record files: {path: ((mtime_ns, size), data)}
+        self._read_cache: OrderedDict = OrderedDict()
+        self._read_cache_lock = threading.Lock()
+        
+        # {id: path} indexes of the <id>_<name>.json files, built from one
+        # directory listing on first use and kept current by the save methods
+        self._team_files: Optional[Dict[int, str]] = None
+        self._team_lastx_files: Optional[Dict[int, str]] = None
+        self._player_files: Optional[Dict[int, str]] = None
+        self._referee_files: Optional[Dict[int, str]] = None
+        
+        # '_saved_at' shared by every save while set (see set_batch_timestamp)
+        self._batch_ts: Optional[str] = None
+        
+        # {relative path: [content hash, mtime_ns, size]} of the last payload
+        # written per file by the skip-unchanged saves. An entry only counts
+        # while the file still has the recorded mtime/size, so a stale or
+        # unflushed index can cost a rewrite but never skip a needed one
+        self.content_hash_file = self.league_dir / "_content_hashes.json"
+        self._content_hashes: Optional[Dict[str, List]] = None
+        self._content_hashes_dirty = False
+    
+    def set_batch_timestamp(self, ts: Optional[str] = None):
+        """
+        Use one '_saved_at' timestamp for every save until the next call
+        
+        Args:
+            ts: ISO timestamp to use; defaults to now
+        """
+        self._batch_ts = ts or datetime.now().isoformat()
+    
+    def _timestamp(self) -> str:
+        """The batch timestamp if one is set, otherwise the current time"""
+        return self._batch_ts or datetime.now().isoformat()
     
     def save_metadata(self, metadata: Dict):
         """Save league metadata"""
         metadata_file = self.league_dir / "metadata.json"
-        metadata['_saved_at'] = datetime.now().isoformat()
+        metadata['_saved_at'] = self._timestamp()
         self._save_json(metadata_file, metadata)
     
     def load_metadata(self) -> Optional[Dict]:
         """Load league metadata"""
         metadata_file = self.league_dir / "metadata.json"
-        return self._load_json(metadata_file)
+        return self._load_json_cached(metadata_file)
     
     def save_league_stats(self, data: Dict):
         """Save league season stats"""
         stats_file = self.league_dir / "league_stats.json"
-        data['_saved_at'] = datetime.now().isoformat()
+        data['_saved_at'] = self._timestamp()
         self._save_json(stats_file, data)
     
     def load_league_stats(self) -> Optional[Dict]:
         """Load league season stats"""
         stats_file = self.league_dir / "league_stats.json"
-        return self._load_json(stats_file)
+        return self._load_json_cached(stats_file)
     
     def save_league_table(self, data: Dict):
         """Save league table"""
         table_file = self.league_dir / "league_table.json"
-        data['_saved_at'] = datetime.now().isoformat()
+        data['_saved_at'] = self._timestamp()
         self._save_json(table_file, data)
     
     def load_league_table(self) -> Optional[Dict]:
         """Load league table"""
         table_file = self.league_dir / "league_table.json"
-        return self._load_json(table_file)
+        return self._load_json_cached(table_file)
     
     def save_team(self, team_id: int, team_name: str, data: Dict):
         """Save team data"""
         # Sanitize team name for filename
         safe_name = self._sanitize_filename(team_name)
-        team_file = self.teams_dir / f"{team_id}_{safe_name}.json"
-        data['_saved_at'] = datetime.now().isoformat()
+        team_file = f"{self._teams_dir_s}{team_id}_{safe_name}.json"
+        data['_saved_at'] = self._timestamp()
         self._save_json(team_file, data)
+        self._index_file(self._team_files, team_id, team_file)
     
     def load_team(self, team_id: int) -> Optional[Dict]:
         """Load team data by ID"""
-        # Find file that starts with team_id
-        for file in self.teams_dir.glob(f"{team_id}_*.json"):
-            if not file.name.endswith("_lastx.json"):
-                return self._load_json(file)
-        return None
+        return self._load_indexed(self._get_team_files(), team_id)
     
     def get_all_team_ids(self) -> List[int]:
         """Get list of all saved team IDs"""
-        team_ids = []
-        for file in self.teams_dir.glob("*_*.json"):
-            if not file.name.endswith("_lastx.json"):
-                try:
-                    team_id = int(file.stem.split('_')[0])
-                    team_ids.append(team_id)
-                except ValueError:
-                    continue
-        return sorted(team_ids)
+        return sorted(self._get_team_files())
+    
+    def load_all_teams(self) -> Dict[int, Dict]:
+        """Load every saved team as {team_id: data} in ID order, reading files concurrently"""
+        return self._load_all_indexed(self._get_team_files())
     
     def save_team_lastx(self, team_id: int, team_name: str, data: Any):
         """Save team last X stats"""
         safe_name = self._sanitize_filename(team_name)
-        lastx_file = self.teams_dir / f"{team_id}_{safe_name}_lastx.json"
+        lastx_file = f"{self._teams_dir_s}{team_id}_{safe_name}_lastx.json"
         
         # Wrap data in an object with metadata
         # data is typically a list from the API
+        # (refreshed every run, so unchanged stats are not rewritten)
         wrapped_data = {
             'team_id': team_id,
             'team_name': team_name,
             'data': data,  # This could be a list or dict from API
-            '_saved_at': datetime.now().isoformat()
+            '_saved_at': self._timestamp()
         }
-        self._save_json(lastx_file, wrapped_data)
+        self._save_changed([(lastx_file, wrapped_data)], flush=False)
+        self._index_file(self._team_lastx_files, team_id, lastx_file)
     
     def load_team_lastx(self, team_id: int) -> Optional[Dict]:
         """Load team last X stats"""
-        for file in self.teams_dir.glob(f"{team_id}_*_lastx.json"):
-            return self._load_json(file)
-        return None
+        self._get_team_files()
+        return self._load_indexed(self._team_lastx_files, team_id)
+    
+    def _get_team_files(self) -> Dict[int, str]:
+        """Index the teams directory (team files and lastX files) on first use"""
+        if self._team_files is None:
+            self._team_files, self._team_lastx_files = {}, {}
+            prefix_len = len(self._teams_dir_s)
+            for team_id, file in self._scan_named_files(self.teams_dir):
+                name = file[prefix_len:]
+                if '_' not in name:
+                    continue
+                if name.endswith("_lastx.json"):
+                    self._team_lastx_files.setdefault(team_id, file)
+                else:
+                    self._team_files.setdefault(team_id, file)
+        return self._team_files
     
     def save_match(self, match_id: int, data: Dict):
         """Save match data"""
-        match_file = self.matches_dir / f"{match_id}.json"
-        data['_saved_at'] = datetime.now().isoformat()
-        self._save_json(match_file, data)
+        data['_saved_at'] = self._timestamp()
+        match_file = f"{self._matches_dir_s}{match_id}.json"
+        if not self._save_json(match_file, data):
+            return
+        self._forget_content_hash(match_file)
+        self._record_match(match_id, data)
+        self._invalidate_gameweek_summary()
+    
+    def save_matches_bulk(self, matches: List[Dict]):
+        """
+        Save a page of matches (keyed by their 'id') as one batch
+        
+        Matches identical to their last saved content are skipped; the rest
+        are written concurrently, sharing one timestamp, one gameweek summary
+        invalidation and one status index write
+        """
+        items = [(f"{self._matches_dir_s}{match.get('id')}.json", match) for match in matches]
+        written, failed = self._save_changed(items)
+        
+        # Matches that failed to save keep their previous index entries
+        for match_file, match in items:
+            if match_file not in failed:
+                self._record_match(match.get('id'), match)
+        
+        if written:
+            self._invalidate_gameweek_summary()
+        self.flush_match_statuses()
+    
+    def _record_match(self, match_id: int, data: Dict):
+        """Record a saved match in the ID listing / status index"""
+        with self._match_cache_lock:
+            self._match_cache.pop(str(match_id), None)
+        
+        file_id = self._file_id(match_id)
+        if file_id is not None:
+            # Only a new or changed status makes the index need rewriting
+            statuses = self._get_status_index()
+            status = self._intern_status(data.get('status'))
+            if file_id not in statuses or statuses[file_id] != status:
+                statuses[file_id] = status
+                self._match_statuses_dirty = True
+            if self._match_ids is not None:
+                self._match_ids.add(file_id)
+    
+    def _invalidate_gameweek_summary(self):
+        """
+        Drop the gameweek summary after a match write (an in-place rewrite
+        doesn't bump the directory mtime readers check it against)
+        """
+        if not self._gameweek_summary_stale:
+            self._gameweek_summary_stale = True
+            self.gameweek_summary_file.unlink(missing_ok=True)
+    
+    def write_gameweek_summary(self):
+        """
+        Write the gameweek summary for betting.DataLoader
+        
+        Rebuilt from the saved matches when matches were saved since the
+        last write, or when the file is missing; stamped with the matches
+        directory mtime so readers can tell files were added/removed since
+        """
+        if not self._gameweek_summary_stale and self.gameweek_summary_file.exists():
+            return
+        
+        max_gameweek = 0
+        completed_gameweeks = 0
+        gameweeks_with_incomplete = set()
+        
+        for match in self.load_all_matches().values():
+            gw = match.get('game_week', 0)
+            # Non-numeric gameweeks can't be compared, so skip them
+            if not isinstance(gw, (int, float)):
+                continue
+            status = match.get('status', '')
+            
+            if gw > max_gameweek:
+                max_gameweek = gw
+            if status == 'complete':
+                completed_gameweeks = max(completed_gameweeks, gw)
+            if status in ('incomplete', 'fixture'):
+                gameweeks_with_incomplete.add(gw)
+        
+        if gameweeks_with_incomplete:
+            next_gameweek = min(gameweeks_with_incomplete)
+        else:
+            next_gameweek = completed_gameweeks + 1
+        
+        tmp_file = self.gameweek_summary_file.with_suffix('.tmp')
+        try:
+            summary = {
+                'mtime': self.matches_dir.stat().st_mtime_ns,
+                'max_gameweek': max_gameweek,
+                'completed_gameweeks': completed_gameweeks,
+                'next_gameweek': next_gameweek
+            }
+            with open(tmp_file, 'wb') as f:
+                f.write(json_dumps_compact(summary))
+            tmp_file.replace(self.gameweek_summary_file)
+            self._gameweek_summary_stale = False
+        except Exception as e:
+            print(f"✗ Error saving {self.gameweek_summary_file}: {e}")
+    
+    def get_match_statuses(self) -> Dict[int, Optional[str]]:
+        """
+        Get {match_id: status} for every saved match, in match ID order
+        
+        Served from the status index; only matches missing from it
+        (e.g. saved before the index existed) are loaded from disk
+        """
+        statuses = self._get_status_index()
+        result = {}
+        
+        for match_id in self.get_all_match_ids():
+            if match_id not in statuses:
+                match = self.load_match(match_id)
+                if not match:
+                    continue
+                statuses[match_id] = self._intern_status(match.get('status'))
+                self._match_statuses_dirty = True
+            result[match_id] = statuses[match_id]
+        
+        self.flush_match_statuses()
+        return result
+    
+    def flush_match_statuses(self):
+        """Persist the match status index if it changed (write-temp-then-rename)"""
+        if not self._match_statuses_dirty:
+            return
+        
+        tmp_file = self.match_status_file.with_suffix('.tmp')
+        try:
+            with open(tmp_file, 'wb') as f:
+                f.write(json_dumps_compact({str(k): v for k, v in self._match_statuses.items()}))
+            tmp_file.replace(self.match_status_file)
+            self._match_statuses_dirty = False
+        except Exception as e:
+            print(f"✗ Error saving {self.match_status_file}: {e}")
+    
+    def flush_content_hashes(self):
+        """Persist the content hash index if it changed (write-temp-then-rename)"""
+        if not self._content_hashes_dirty:
+            return
+        
+        tmp_file = self.content_hash_file.with_suffix('.tmp')
+        try:
+            with open(tmp_file, 'wb') as f:
+                f.write(json_dumps_compact(self._content_hashes))
+            tmp_file.replace(self.content_hash_file)
+            self._content_hashes_dirty = False
+        except Exception as e:
+            print(f"✗ Error saving {self.content_hash_file}: {e}")
+    
+    def _get_content_hashes(self) -> Dict[str, List]:
+        """Load the content hash index on first use"""
+        if self._content_hashes is None:
+            self._content_hashes = self._load_json(self.content_hash_file) or {}
+        return self._content_hashes
+    
+    def _forget_content_hash(self, filepath: Union[str, Path]):
+        """Drop a file's hash after an unconditional save so the next batch rewrites it"""
+        key = self._relative_key(filepath)
+        if self._get_content_hashes().pop(key, None) is not None:
+            self._content_hashes_dirty = True
+    
+    def _relative_key(self, filepath: Union[str, Path]) -> str:
+        """A league file's path relative to the league directory, '/'-separated"""
+        key = str(filepath)[len(self._league_dir_s):]
+        return key.replace(os.sep, '/') if os.sep != '/' else key
+    
+    def _get_status_index(self) -> Dict[int, Optional[str]]:
+        """Load the match status index on first use"""
+        if self._match_statuses is None:
+            stored = self._load_json(self.match_status_file) or {}
+            self._match_statuses = {int(k): self._intern_status(v) for k, v in stored.items()}
+        return self._match_statuses
+    
+    @staticmethod
+    def _intern_status(status: Any) -> Any:
+        """
+        Intern a status string so the index holds one object per distinct
+        status and comparisons against literals like 'complete' are
+        identity checks
+        """
+        return sys.intern(status) if type(status) is str else status
     
     def load_match(self, match_id: int) -> Optional[Dict]:
-        """Load match data"""
-        match_file = self.matches_dir / f"{match_id}.json"
-        return self._load_json(match_file)
+        """
+        Load match data
+        
+        Recently loaded matches are served from memory (dropped again when
+        the match is saved), so callers must treat the result as read-only
+        """
+        key = str(match_id)
+        with self._match_cache_lock:
+            match = self._match_cache.get(key)
+            if match is not None:
+                self._match_cache.move_to_end(key)
+                return match
+        
+        match = self._load_json(f"{self._matches_dir_s}{key}.json")
+        if match is not None:
+            with self._match_cache_lock:
+                self._match_cache[key] = match
+                if len(self._match_cache) > MATCH_CACHE_SIZE:
+                    self._match_cache.popitem(last=False)
+        return match
     
     def get_all_match_ids(self) -> List[int]:
         """Get list of all saved match IDs"""
-        match_ids = []
-        for file in self.matches_dir.glob("*.json"):
-            try:
-                match_id = int(file.stem)
-                match_ids.append(match_id)
-            except ValueError:
-                continue
-        return sorted(match_ids)
+        if self._match_ids is None:
+            self._match_ids = self._scan_ids(self.matches_dir)
+        return sorted(self._match_ids)
+    
+    def load_all_matches(self) -> Dict[int, Dict]:
+        """Load every saved match as {match_id: data} in ID order, reading files concurrently"""
+        match_ids = self.get_all_match_ids()
+        matches = self._load_json_many([f"{self._matches_dir_s}{match_id}.json" for match_id in match_ids])
+        return {match_id: match for match_id, match in zip(match_ids, matches) if match is not None}
     
     def save_match_details(self, match_id: int, data: Dict):
         """Save detailed match data"""
-        match_file = self.match_details_dir / f"{match_id}.json"
-        data['_saved_at'] = datetime.now().isoformat()
-        self._save_json(match_file, data)
+        match_file = f"{self._match_details_dir_s}{match_id}.json"
+        data['_saved_at'] = self._timestamp()
+        if not self._save_json(match_file, data):
+            return
+        
+        file_id = self._file_id(match_id)
+        if file_id is None:
+            return
+        
+        detail_ids = self._get_detail_ids()
+        if file_id not in detail_ids:
+            detail_ids.add(file_id)
+            try:
+                with open(self.match_detail_index_file, 'ab') as f:
+                    f.write(array('q', [file_id]).tobytes())
+            except Exception as e:
+                print(f"✗ Error saving {self.match_detail_index_file}: {e}")
     
     def load_match_details(self, match_id: int) -> Optional[Dict]:
         """Load detailed match data"""
-        match_file = self.match_details_dir / f"{match_id}.json"
-        return self._load_json(match_file)
+        match_file = f"{self._match_details_dir_s}{match_id}.json"
+        return self._load_json_cached(match_file)
     
     def get_all_match_detail_ids(self) -> List[int]:
         """Get list of all saved match detail IDs"""
         if not self.match_details_dir.exists():
             return []
         
-        match_ids = []
-        for file in self.match_details_dir.glob("*.json"):
-            try:
-                match_id = int(file.stem)
-                match_ids.append(match_id)
-            except ValueError:
-                continue
-        return sorted(match_ids)
+        return sorted(self._get_detail_ids())
+    
+    def _get_detail_ids(self) -> Set[int]:
+        """
+        Load the match detail IDs on first use
+        
+        The packed index is trusted only while it is strictly newer than the
+        directory (adding or removing files bumps the directory mtime; on
+        filesystems with coarse timestamps a file added in the same tick as
+        the index write leaves them equal); otherwise it is rebuilt from a
+        directory scan
+        """
+        if self._match_detail_ids is not None:
+            return self._match_detail_ids
+        
+        try:
+            if self.match_detail_index_file.stat().st_mtime_ns > self.match_details_dir.stat().st_mtime_ns:
+                ids = array('q')
+                ids.frombytes(self.match_detail_index_file.read_bytes())
+                self._match_detail_ids = set(ids)
+                return self._match_detail_ids
+        except (OSError, ValueError):
+            pass
+        
+        self._match_detail_ids = self._scan_ids(self.match_details_dir)
+        tmp_file = self.match_detail_index_file.with_suffix('.tmp')
+        try:
+            with open(tmp_file, 'wb') as f:
+                f.write(array('q', sorted(self._match_detail_ids)).tobytes())
+            tmp_file.replace(self.match_detail_index_file)
+        except Exception as e:
+            print(f"✗ Error saving {self.match_detail_index_file}: {e}")
+        return self._match_detail_ids
+    
+    @staticmethod
+    def _scan_ids(directory: Path) -> Set[int]:
+        """IDs of the <id>.json files in a directory"""
+        # IDs are plain digit runs (we write these names), so a C-level
+        # isdecimal() check replaces exception-driven int() parsing
+        ids = set()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.endswith('.json'):
+                    stem = name[:-5]
+                    if stem.isdecimal():
+                        ids.add(int(stem))
+        return ids
+    
+    @staticmethod
+    def _file_id(key: Any) -> Optional[int]:
+        """The ID a listing scan would read back from <key>.json, or None"""
+        key = str(key)
+        return int(key) if key.isdecimal() else None
     
     def save_player(self, player_id: int, player_name: str, data: Dict):
         """Save player data"""
-        safe_name = self._sanitize_filename(player_name)
-        player_file = self.players_dir / f"{player_id}_{safe_name}.json"
-        data['_saved_at'] = datetime.now().isoformat()
+        player_file = self._player_file(player_id, player_name)
+        data['_saved_at'] = self._timestamp()
         self._save_json(player_file, data)
+        self._forget_content_hash(player_file)
+        self._index_file(self._player_files, player_id, player_file)
+    
+    def save_players_bulk(self, players: List[Tuple[int, str, Dict]]):
+        """Save a page of (player_id, player_name, data) records, skipping unchanged ones"""
+        items = [
+            (player_id, self._player_file(player_id, player_name), data)
+            for player_id, player_name, data in players
+        ]
+        self._save_changed([(player_file, data) for _player_id, player_file, data in items])
+        
+        for player_id, player_file, _data in items:
+            self._index_file(self._player_files, player_id, player_file)
+    
+    def _player_file(self, player_id: int, player_name: str) -> str:
+        safe_name = self._sanitize_filename(player_name)
+        return f"{self._players_dir_s}{player_id}_{safe_name}.json"
     
     def load_player(self, player_id: int) -> Optional[Dict]:
         """Load player data"""
-        for file in self.players_dir.glob(f"{player_id}_*.json"):
-            return self._load_json(file)
-        return None
+        return self._load_indexed(self._get_player_files(), player_id)
     
     def get_all_player_ids(self) -> List[int]:
         """Get list of all saved player IDs"""
-        player_ids = []
-        for file in self.players_dir.glob("*.json"):
-            try:
-                player_id = int(file.stem.split('_')[0])
-                player_ids.append(player_id)
-            except ValueError:
-                continue
-        return sorted(player_ids)
+        return sorted(self._get_player_files())
+    
+    def load_all_players(self) -> Dict[int, Dict]:
+        """Load every saved player as {player_id: data} in ID order, reading files concurrently"""
+        return self._load_all_indexed(self._get_player_files())
+    
+    def _get_player_files(self) -> Dict[int, str]:
+        """Index the players directory on first use"""
+        if self._player_files is None:
+            self._player_files = {}
+            for player_id, file in self._scan_named_files(self.players_dir):
+                self._player_files.setdefault(player_id, file)
+        return self._player_files
     
     def save_referee(self, referee_id: int, referee_name: str, data: Dict):
         """Save referee data"""
         safe_name = self._sanitize_filename(referee_name)
-        referee_file = self.referees_dir / f"{referee_id}_{safe_name}.json"
-        data['_saved_at'] = datetime.now().isoformat()
+        referee_file = f"{self._referees_dir_s}{referee_id}_{safe_name}.json"
+        data['_saved_at'] = self._timestamp()
         self._save_json(referee_file, data)
+        self._index_file(self._referee_files, referee_id, referee_file)
     
     def load_referee(self, referee_id: int) -> Optional[Dict]:
         """Load referee data"""
-        for file in self.referees_dir.glob(f"{referee_id}_*.json"):
-            return self._load_json(file)
-        return None
+        return self._load_indexed(self._get_referee_files(), referee_id)
     
     def get_all_referee_ids(self) -> List[int]:
         """Get list of all saved referee IDs"""
-        referee_ids = []
-        for file in self.referees_dir.glob("*.json"):
-            try:
-                referee_id = int(file.stem.split('_')[0])
-                referee_ids.append(referee_id)
-            except ValueError:
-                continue
-        return sorted(referee_ids)
+        return sorted(self._get_referee_files())
+    
+    def _get_referee_files(self) -> Dict[int, str]:
+        """Index the referees directory on first use"""
+        if self._referee_files is None:
+            self._referee_files = {}
+            for referee_id, file in self._scan_named_files(self.referees_dir):
+                self._referee_files.setdefault(referee_id, file)
+        return self._referee_files
+    
+    @staticmethod
+    def _scan_named_files(directory: Path) -> List[Tuple[int, str]]:
+        """
+        (id, path) for each <id>[_<name>].json file, from one directory listing
+        
+        Args:
+            directory: Directory to list
+            
+        Returns:
+            Pairs in listing order (paths as the listing's joined strings);
+            names without a numeric ID are skipped
+        """
+        found = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.endswith('.json'):
+                        prefix = name[:-5].partition('_')[0]
+                        if prefix.isdecimal():
+                            found.append((int(prefix), entry.path))
+        except FileNotFoundError:
+            pass
+        return found
+    
+    def _index_file(self, index: Optional[Dict[int, str]], key: Any, filepath: str):
+        """Point a loaded file index at a just-saved file"""
+        file_id = self._file_id(key)
+        if index is not None and file_id is not None:
+            index[file_id] = filepath
+    
+    def _load_all_indexed(self, index: Dict[int, str]) -> Dict[int, Dict]:
+        """Load every file of an ID index as {id: data}, skipping unreadable ones"""
+        file_ids = sorted(index)
+        loaded = self._load_json_many([index[file_id] for file_id in file_ids])
+        return {file_id: data for file_id, data in zip(file_ids, loaded) if data is not None}
+    
+    def _load_indexed(self, index: Dict[int, str], key: Any) -> Optional[Dict]:
+        """Load the file an index holds for an ID, if any"""
+        file_id = self._file_id(key)
+        filepath = index.get(file_id) if file_id is not None else None
+        return self._load_json_cached(filepath) if filepath is not None else None
     
     def save_h2h(self, team_a_id: int, team_b_id: int, data: Dict):
         """Save head-to-head data"""
@@ -219,9 +666,9 @@ class DataManager:
         if team_a_id > team_b_id:
             team_a_id, team_b_id = team_b_id, team_a_id
         
-        h2h_file = self.h2h_dir / f"{team_a_id}_vs_{team_b_id}.json"
-        data['_saved_at'] = datetime.now().isoformat()
-        self._save_json(h2h_file, data)
+        # Regenerated every run; pairs whose matches didn't change are not rewritten
+        h2h_file = f"{self._h2h_dir_s}{team_a_id}_vs_{team_b_id}.json"
+        self._save_changed([(h2h_file, data)], flush=False)
     
     def load_h2h(self, team_a_id: int, team_b_id: int) -> Optional[Dict]:
         """Load head-to-head data"""
@@ -229,8 +676,8 @@ class DataManager:
         if team_a_id > team_b_id:
             team_a_id, team_b_id = team_b_id, team_a_id
         
-        h2h_file = self.h2h_dir / f"{team_a_id}_vs_{team_b_id}.json"
-        return self._load_json(h2h_file)
+        h2h_file = f"{self._h2h_dir_s}{team_a_id}_vs_{team_b_id}.json"
+        return self._load_json_cached(h2h_file)
     
     def _sanitize_filename(self, name: str) -> str:
         """
@@ -242,39 +689,154 @@ class DataManager:
         Returns:
             Sanitized name safe for filesystem
         """
-        # Replace spaces with underscores
-        name = name.replace(' ', '_')
+        # Spaces become underscores, other special characters are dropped,
+        # then lowercase and limit length
+        return _sanitize_name(name)
+    
+    def _save_json(self, filepath: Union[str, Path], data: Any) -> bool:
+        """Save data as JSON, returning whether the write succeeded"""
+        with self._read_cache_lock:
+            self._read_cache.pop(str(filepath), None)
+        
+        try:
+            payload = json_dumps_bytes(data)
+            with open(filepath, 'wb') as f:
+                f.write(payload)
+            return True
+        except Exception as e:
+            print(f"✗ Error saving {filepath}: {e}")
+            return False
+    
+    def _save_json_many(self, items: List[Tuple[Union[str, Path], Any]]) -> List[Union[str, Path]]:
+        """
+        Save several JSON files concurrently
         
-        # Remove special characters
-        safe_chars = []
-        for char in name:
-            if char.isalnum() or char in ['_', '-']:
-                safe_chars.append(char)
+        Each file is independent I/O; if a path repeats, only its last
+        payload is written (same result as saving sequentially)
         
-        result = ''.join(safe_chars).lower()
+        Returns:
+            Paths that were written successfully
+        """
+        by_path = dict(items)
+        if len(by_path) <= 1:
+            results = [self._save_json(filepath, data) for filepath, data in by_path.items()]
+        else:
+            with ThreadPoolExecutor(max_workers=SAVE_WORKERS) as pool:
+                results = list(pool.map(self._save_json, by_path.keys(), by_path.values()))
         
-        # Limit length
-        return result[:50]
+        return [filepath for filepath, ok in zip(by_path, results) if ok]
     
-    def _save_json(self, filepath: Path, data: Any):
-        """Save data as JSON"""
+    def _save_changed(self, items: List[Tuple[Union[str, Path], Dict]], flush: bool = True) -> Tuple[int, Set]:
+        """
+        Save records whose content differs from the last saved version
+        
+        Unchanged records (same content hash, file untouched since) are not
+        rewritten and keep their previous '_saved_at'; the rest share one
+        timestamp. Hashes are only recorded for successful writes
+        
+        Args:
+            items: (filepath, data) pairs
+            flush: Persist the hash index now; per-record callers pass False
+                   and call flush_content_hashes once at the end
+        
+        Returns:
+            (number of files written, paths whose write failed)
+        """
+        hashes = self._get_content_hashes()
+        saved_at = self._timestamp()
+        pending = {}
+        
+        for filepath, data in dict(items).items():
+            key = self._relative_key(filepath)
+            digest = content_hash(data)
+            if self._is_unchanged(hashes.get(key), filepath, digest):
+                continue
+            data['_saved_at'] = saved_at
+            pending[filepath] = (key, digest, data)
+        
+        if not pending:
+            return 0, set()
+        
+        written = self._save_json_many([
+            (filepath, data) for filepath, (_key, _digest, data) in pending.items()
+        ])
+        for filepath in written:
+            key, digest, _data = pending[filepath]
+            try:
+                stat = os.stat(filepath)
+                hashes[key] = [digest, stat.st_mtime_ns, stat.st_size]
+            except OSError:
+                hashes.pop(key, None)
+        
+        if written:
+            self._content_hashes_dirty = True
+            if flush:
+                self.flush_content_hashes()
+        return len(written), pending.keys() - set(written)
+    
+    @staticmethod
+    def _is_unchanged(entry: Optional[List], filepath: Union[str, Path], digest: str) -> bool:
+        """Whether a hash index entry matches the digest and the file as it is on disk"""
+        if not isinstance(entry, list) or len(entry) != 3 or entry[0] != digest:
+            return False
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            print(f"✗ Error saving {filepath}: {e}")
+            stat = os.stat(filepath)
+        except OSError:
+            return False
+        return entry[1] == stat.st_mtime_ns and entry[2] == stat.st_size
     
-    def _load_json(self, filepath: Path) -> Optional[Dict]:
+    def _load_json(self, filepath: Union[str, Path]) -> Optional[Dict]:
         """Load JSON data"""
-        if not filepath.exists():
-            return None
-        
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(filepath, 'rb') as f:
+                return json_loads(f.read())
+        except FileNotFoundError:
+            return None
         except Exception as e:
             print(f"✗ Error loading {filepath}: {e}")
             return None
+    
+    def _load_json_cached(self, filepath: Union[str, Path]) -> Optional[Dict]:
+        """
+        Load JSON data through the read cache
+        
+        A cached parse is reused while the file still has the mtime/size it
+        had when read (saves drop the entry outright), so callers must treat
+        the result as read-only
+        """
+        key = str(filepath)
+        try:
+            stat = os.stat(key)
+        except OSError:
+            return None
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        
+        with self._read_cache_lock:
+            cached = self._read_cache.get(key)
+            if cached is not None and cached[0] == stamp:
+                self._read_cache.move_to_end(key)
+                return cached[1]
+        
+        data = self._load_json(key)
+        if data is not None:
+            with self._read_cache_lock:
+                self._read_cache[key] = (stamp, data)
+                if len(self._read_cache) > READ_CACHE_SIZE:
+                    self._read_cache.popitem(last=False)
+        return data
+    
+    def _load_json_many(self, paths: List[Union[str, Path]]) -> List[Optional[Dict]]:
+        """
+        Load several JSON files concurrently
+        
+        Returns:
+            Loaded data per path, in the same order (None where loading failed)
+        """
+        if len(paths) < 8:
+            return [self._load_json(filepath) for filepath in paths]
+        
+        with ThreadPoolExecutor(max_workers=LOAD_WORKERS) as pool:
+            return list(pool.map(self._load_json, paths))
 
 
 class GlobalDataManager:
@@ -283,10 +845,10 @@ class GlobalDataManager:
     """
     
     @staticmethod
-    def save_btts_stats(data: Dict):
-        """Save BTTS stats"""
+    def save_btts_stats(data: Dict, ts: Optional[str] = None):
+        """Save BTTS stats (ts: optional batch timestamp for '_saved_at')"""
         stats_file = STATS_DIR / "btts_stats.json"
-        data['_saved_at'] = datetime.now().isoformat()
+        data['_saved_at'] = ts or datetime.now().isoformat()
         GlobalDataManager._save_json(stats_file, data)
     
     @staticmethod
@@ -296,10 +858,10 @@ class GlobalDataManager:
         return GlobalDataManager._load_json(stats_file)
     
     @staticmethod
-    def save_over25_stats(data: Dict):
-        """Save Over 2.5 stats"""
+    def save_over25_stats(data: Dict, ts: Optional[str] = None):
+        """Save Over 2.5 stats (ts: optional batch timestamp for '_saved_at')"""
         stats_file = STATS_DIR / "over25_stats.json"
-        data['_saved_at'] = datetime.now().isoformat()
+        data['_saved_at'] = ts or datetime.now().isoformat()
         GlobalDataManager._save_json(stats_file, data)
     
     @staticmethod
@@ -312,8 +874,9 @@ class GlobalDataManager:
     def _save_json(filepath: Path, data: Any):
         """Save data as JSON"""
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            payload = json_dumps_bytes(data)
+            with open(filepath, 'wb') as f:
+                f.write(payload)
         except Exception as e:
             print(f"✗ Error saving {filepath}: {e}")
     
@@ -324,8 +887,7 @@ class GlobalDataManager:
             return None
         
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return json_loads(filepath.read_bytes())
         except Exception as e:
             print(f"✗ Error loading {filepath}: {e}")
             return None
\ No newline at end of file
@@ -53,10 +53,11 @@ class LeagueMapper:
         
         api_leagues = response.get('data', [])
         mapped_leagues = {}
+        leagues_by_name = self._index_leagues_by_name(api_leagues)
         
         # Map each target league to its API data using exact name match
         for key, target in TARGET_LEAGUES.items():
-            matched = self._find_league_by_name(target['name'], api_leagues)
+            matched = leagues_by_name.get(target['name'])
             if matched:
                 # Format seasons with proper year display
                 formatted_seasons = []
@@ -91,21 +92,22 @@ class LeagueMapper:
         print(f"\n✓ Cached league data to {self.CACHE_FILE}")
         return mapped_leagues
     
-    def _find_league_by_name(self, target_name: str, api_leagues: List[Dict]) -> Optional[Dict]:
+    def _index_leagues_by_name(self, api_leagues: List[Dict]) -> Dict[str, Dict]:
         """
-        Find league in API data by exact name match
+        Index API leagues by exact name, so each target is a dict lookup
+        instead of a scan of the whole league list
         
         Args:
-            target_name: The exact league name we're looking for
             api_leagues: List of leagues from API
             
         Returns:
-            The matching league dict with 'name' and 'season' keys, or None
+            {name: league dict with 'name' and 'season' keys}; the first
+            league listed wins if a name repeats
         """
+        leagues_by_name = {}
         for league in api_leagues:
-            if league.get('name') == target_name:
-                return league
-        return None
+            leagues_by_name.setdefault(league.get('name'), league)
+        return leagues_by_name
     
     def _format_year(self, year: int) -> str:
         """
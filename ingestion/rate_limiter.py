@@ -4,6 +4,7 @@ Rate limiter to handle 1800 requests per hour limit
 
 import time
 import json
+import threading
 from pathlib import Path
 from typing import Optional
 from datetime import datetime, timedelta
@@ -22,6 +23,9 @@ class RateLimiter:
         self.requests_per_hour = requests_per_hour
         self.current_hour_start = None
         self.calls_this_hour = 0
+        
+        # Collectors fetch from worker threads; serialize the counter/state file
+        self._lock = threading.RLock()
         self.load_state()
     
     def load_state(self):
@@ -90,6 +94,11 @@ class RateLimiter:
         Returns:
             Number of seconds waited, or None if no wait was needed
         """
+        with self._lock:
+            return self._wait_if_needed()
+    
+    def _wait_if_needed(self) -> Optional[int]:
+        """wait_if_needed body, called with the lock held"""
         if self.can_make_request():
             return None
         
@@ -109,17 +118,36 @@ class RateLimiter:
         
         return None
     
+    def acquire(self) -> Optional[int]:
+        """
+        Wait until a request is allowed, then reserve it
+        
+        The check and the count happen under one lock hold, so concurrent
+        callers can't all pass the check before any of them is counted
+        and overshoot the hourly limit. Call this before each API request
+        instead of wait_if_needed + record_request
+        
+        Returns:
+            Number of seconds waited, or None if no wait was needed
+        """
+        with self._lock:
+            waited = self._wait_if_needed()
+            self.calls_this_hour += 1
+            self.save_state()
+            return waited
+    
     def record_request(self):
         """
         Record that a request was made
         Call this after each successful API request
         """
-        # Check if we need to reset the hour
-        if not self.current_hour_start or datetime.now() >= self.current_hour_start + timedelta(hours=1):
-            self.reset_hour()
-        
-        self.calls_this_hour += 1
-        self.save_state()
+        with self._lock:
+            # Check if we need to reset the hour
+            if not self.current_hour_start or datetime.now() >= self.current_hour_start + timedelta(hours=1):
+                self.reset_hour()
+            
+            self.calls_this_hour += 1
+            self.save_state()
     
     def get_remaining_requests(self) -> int:
         """
@@ -89,6 +89,7 @@ def ingest_single_league():
     
     # Initialize managers and collectors
     data_manager = DataManager(league_key, season['id'], season['year'])
+    data_manager.set_batch_timestamp()  # one '_saved_at' for everything this run saves
     state = IngestionState(league_key, season['id'], season['year'])
     
     # Check existing state
@@ -302,6 +303,7 @@ def update_all_leagues():
         try:
             # Initialize managers
             data_manager = DataManager(league_key, latest_season['id'], latest_season['year'])
+            data_manager.set_batch_timestamp()
             state = IngestionState(league_key, latest_season['id'], latest_season['year'])
             
             # Initialize collectors
@@ -5,7 +5,7 @@ Allows resuming interrupted ingestions
 
 import json
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Dict, Iterable, Optional, List
 from datetime import datetime
 from .config import STATE_DIR
 
@@ -132,8 +132,8 @@ class IngestionState:
             self.save()
     
     def update_collection_progress(self, collection: str, fetched: int, total: Optional[int] = None, 
-                                   ids: Optional[List] = None, api_calls: int = 0):
-        """Update progress for a collection"""
+                                   ids: Optional[Iterable] = None, api_calls: int = 0):
+        """Update progress for a collection (ids may be any iterable; it is merged, not kept)"""
         if collection in self.state['collections']:
             coll_state = self.state['collections'][collection]
             coll_state['fetched'] = fetched
@@ -146,19 +146,19 @@ class IngestionState:
                 if 'team_ids' in coll_state:
                     existing = set(coll_state['team_ids'])
                     existing.update(ids)
-                    coll_state['team_ids'] = sorted(list(existing))
+                    coll_state['team_ids'] = sorted(existing)
                 elif 'match_ids' in coll_state:
                     existing = set(coll_state['match_ids'])
                     existing.update(ids)
-                    coll_state['match_ids'] = sorted(list(existing))
+                    coll_state['match_ids'] = sorted(existing)
                 elif 'player_ids' in coll_state:
                     existing = set(coll_state['player_ids'])
                     existing.update(ids)
-                    coll_state['player_ids'] = sorted(list(existing))
+                    coll_state['player_ids'] = sorted(existing)
                 elif 'referee_ids' in coll_state:
                     existing = set(coll_state['referee_ids'])
                     existing.update(ids)
-                    coll_state['referee_ids'] = sorted(list(existing))
+                    coll_state['referee_ids'] = sorted(existing)
             
             if api_calls > 0:
                 coll_state['api_calls'] = coll_state.get('api_calls', 0) + api_calls
@@ -5,13 +5,32 @@ Runs after ingestion is complete - no API calls required
 """
 
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any, Set
-from collections import defaultdict
+from typing import Dict, List, Any, Optional, Set
+from collections import defaultdict, OrderedDict
 from datetime import datetime
 from .config import LEAGUES_DIR, DATA_DIR
+from .utils import json_loads
 from .utils import get_team_name_from_data
 
+# League directories whose matches are kept in memory while aggregating. Teams
+# are visited roughly league by league, and European competitions come up for
+# many teams, so a small LRU serves most lookups
+LEAGUE_MATCH_CACHE_SIZE = 8
+
+# Match files are independent disk reads, so overlap them
+MATCH_LOAD_WORKERS = 16
+
+
+def _read_match(match_file: Path) -> Optional[Any]:
+    """Parse one match file, or None if it can't be read"""
+    try:
+        return json_loads(match_file.read_bytes())
+    except Exception:
+        return None
+
 
 class TeamAggregator:
     """
@@ -22,6 +41,9 @@ class TeamAggregator:
     def __init__(self):
         self.teams_dir = DATA_DIR / "teams"
         self.teams_dir.mkdir(parents=True, exist_ok=True)
+        
+        # {league_dir: {team_id: [match, ...]}}, see LEAGUE_MATCH_CACHE_SIZE
+        self._league_matches: OrderedDict = OrderedDict()
     
     def aggregate_all_teams(self) -> Dict[str, Any]:
         """
@@ -227,23 +249,14 @@ class TeamAggregator:
         for comp in competitions:
             league_dir = Path(comp['league_dir'])
             
-            # Load matches
+            # Load matches (the team's matches in this league, in file listing order)
             matches_dir = league_dir / "matches"
             if matches_dir.exists():
-                team_matches = []
-                for match_file in matches_dir.glob("*.json"):
-                    try:
-                        with open(match_file, 'r') as f:
-                            match = json.load(f)
-                        
-                        # Check if team is involved
-                        if match.get('homeID') == team_id or match.get('awayID') == team_id:
-                            # Add competition context
-                            match['_league_key'] = comp['league_key']
-                            match['_season_id'] = comp['season_id']
-                            team_matches.append(match)
-                    except Exception:
-                        continue
+                team_matches = self._get_matches_by_team(matches_dir).get(team_id, [])
+                for match in team_matches:
+                    # Add competition context
+                    match['_league_key'] = comp['league_key']
+                    match['_season_id'] = comp['season_id']
                 
                 all_fixtures.extend(team_matches)
             
@@ -288,6 +301,40 @@ class TeamAggregator:
                 'last_updated': datetime.now().isoformat()
             }, f, indent=2)
     
+    def _get_matches_by_team(self, matches_dir: Path) -> Dict[Any, List[Dict[str, Any]]]:
+        """
+        Group a league's matches by home/away team ID
+        
+        The match files are read concurrently once per league directory
+        rather than once per team, and the result is kept in a small LRU
+        """
+        key = str(matches_dir)
+        cached = self._league_matches.get(key)
+        if cached is not None:
+            self._league_matches.move_to_end(key)
+            return cached
+        
+        with os.scandir(matches_dir) as entries:
+            match_files = [Path(entry.path) for entry in entries if entry.name.endswith('.json')]
+        
+        with ThreadPoolExecutor(max_workers=MATCH_LOAD_WORKERS) as executor:
+            matches = list(executor.map(_read_match, match_files))
+        
+        by_team = defaultdict(list)
+        for match in matches:
+            if not isinstance(match, dict):
+                continue
+            home_id = match.get('homeID')
+            away_id = match.get('awayID')
+            by_team[home_id].append(match)
+            if away_id != home_id:
+                by_team[away_id].append(match)
+        
+        self._league_matches[key] = by_team
+        if len(self._league_matches) > LEAGUE_MATCH_CACHE_SIZE:
+            self._league_matches.popitem(last=False)
+        return by_team
+    
     def _calculate_aggregated_stats(self, competition_stats: Dict[str, Any], 
                                    fixtures: List[Dict[str, Any]], 
                                    team_id: int) -> Dict[str, Any]:
@@ -2,8 +2,45 @@
 Utility functions for the ingestion system
 """
 
-from typing import Dict, List, Optional
+import json
+from collections import deque
+from concurrent.futures import Executor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
 from datetime import datetime
+from .config import COMPACT_JSON
+
+# orjson parses/serializes several times faster when available; stdlib json otherwise
+try:
+    import orjson
+    from orjson import loads as json_loads
+except ImportError:
+    orjson = None
+    from json import loads as json_loads
+
+
+def json_dumps_bytes(data: Any) -> bytes:
+    """
+    Serialize to pretty-printed UTF-8 JSON (same layout as json.dump(indent=2)),
+    or compact JSON when COMPACT_JSON is set
+    """
+    if COMPACT_JSON:
+        return json_dumps_compact(data)
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits - stdlib json handles those
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def json_dumps_compact(data: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON (no whitespace) for indexes and hashing"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
 
 
 def format_timestamp(timestamp: Optional[int]) -> str:
@@ -280,4 +317,36 @@ def chunk_list(lst: List, chunk_size: int) -> List[List]:
     Returns:
         List of chunks
     """
-    return [lst[i:i + chunk_size] for i in range(0, len(lst), chunk_size)]
\ No newline at end of file
+    return [lst[i:i + chunk_size] for i in range(0, len(lst), chunk_size)]
+
+
+def map_bounded(executor: Executor, fn: Callable, items: Iterable, window: int) -> Iterator:
+    """
+    Like executor.map, but keeps at most `window` calls submitted ahead of
+    the consumer
+    
+    executor.map submits every call up front, so a consumer that stops early
+    (error, KeyboardInterrupt) would still have all of them run by the
+    executor's shutdown. Here at most `window` are left over, and those not
+    yet started are cancelled once the iterator is closed
+    
+    Args:
+        executor: Executor to run the calls on
+        fn: Function called with each item
+        items: Items to map over
+        window: Maximum number of calls in flight or queued
+        
+    Returns:
+        Iterator of results, in item order
+    """
+    pending = deque()
+    try:
+        for item in items:
+            pending.append(executor.submit(fn, item))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
\ No newline at end of file